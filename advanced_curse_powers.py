@@ -2,9 +2,13 @@
 Advanced Curse Powers for DungeonCrawlerAI.
 Extends the base PlayerCurse with more powerful abilities organized by tier.
 """
-from enum import Enum
+from array import array
+from enum import Enum, IntEnum
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
+import copy
+import heapq
+import itertools
 import random
 
 from models import Hero, Enemy, EnemyType, Trap, TrapType
@@ -12,6 +16,13 @@ from dungeon import Dungeon
 from events import EventBus, Event, EventType
 
 
+# Bits of AdvancedCursePowers._any_active, one per kind of timed effect
+_ACTIVE_DOOM = 1
+_ACTIVE_CHARM = 2
+_ACTIVE_FREEZE = 4
+_ACTIVE_BLESSING = 8
+
+
 class CursePowerTier(Enum):
     """Tier levels for curse powers"""
     BASIC = "basic"
@@ -19,7 +30,24 @@ class CursePowerTier(Enum):
     ULTIMATE = "ultimate"
 
 
-@dataclass
+class PowerId(IntEnum):
+    """Dense integer ids for curse powers, used to index per-power tables"""
+    TRIGGER_TRAP = 0
+    ALTER_ROOM = 1
+    CORRUPT_LOOT = 2
+    MUTATE_ENEMY = 3
+    SPAWN_TRAP = 4
+    TELEPORT_HERO = 5
+    CHARM_ENEMY = 6
+    TIME_FREEZE = 7
+    MASS_CORRUPTION = 8
+    SUMMON_ENEMY = 9
+    DOOM = 10
+    DARK_BLESSING = 11
+    DUNGEON_COLLAPSE = 12
+
+
+@dataclass(frozen=True, slots=True)
 class CursePower:
     """Represents a curse power and its properties"""
     name: str
@@ -55,65 +83,148 @@ class AdvancedCursePowers:
         "dungeon_collapse": CursePower("dungeon_collapse", "Destroy room and damage hero", 75, 60, CursePowerTier.ULTIMATE, 8),
     }
     
-    def __init__(self, dungeon: Dungeon, event_bus: EventBus):
+    # Power names resolve to a PowerId once at the public API boundary
+    _NAME_TO_ID: Dict[str, PowerId] = {pid.name.lower(): pid for pid in PowerId}
+    
+    # Flattened (energy_cost, suspicion_increase, cooldown, is_ultimate) indexed by PowerId,
+    # so hot-path checks are a tuple index instead of a string-keyed dict lookup
+    _POWER_TABLE: Tuple[Tuple[int, int, int, bool], ...] = tuple(
+        (p.energy_cost, p.suspicion_increase, p.cooldown, p.tier is CursePowerTier.ULTIMATE)
+        for p in map(POWERS.__getitem__, _NAME_TO_ID)
+    )
+    
+    # Summon templates, cloned rather than constructed on every summon
+    _ENEMY_PROTOTYPES: Dict[EnemyType, Enemy] = {
+        EnemyType.GOBLIN: Enemy(EnemyType.GOBLIN, "Summoned Goblin", 30, 8, 2),
+        EnemyType.ORC: Enemy(EnemyType.ORC, "Summoned Orc", 50, 12, 5),
+        EnemyType.SKELETON: Enemy(EnemyType.SKELETON, "Summoned Skeleton", 40, 10, 3),
+        EnemyType.DRAGON: Enemy(EnemyType.DRAGON, "Summoned Dragon", 150, 25, 10),
+    }
+    
+    def __init__(self, dungeon: Dungeon, event_bus: EventBus, seed: Optional[int] = None):
         """
         Initialize advanced curse powers.
         
         Args:
             dungeon: The dungeon instance to manipulate
             event_bus: Event bus for publishing events
+            seed: Optional seed for this instance's random number generator
         """
         self.dungeon = dungeon
         self.event_bus = event_bus
+        self._rng = random.Random(seed)
         self.curse_energy = 100
         self.max_curse_energy = 150
         self.actions_taken = 0
         self.current_turn = 0
         
-        # Cooldown tracking: power_name -> turn when available
-        self._cooldowns: Dict[str, int] = {}
+        # Cooldown tracking: turn when each power is available, indexed by PowerId
+        self._cooldowns = array('i', [0] * len(PowerId))
         
         # Active effects
         self._time_freeze_remaining = 0
         self._dark_blessing_remaining = 0
-        self._doom_targets: Dict[int, int] = {}  # hero_id -> turns remaining
-        self._charmed_enemies: Dict[int, int] = {}  # enemy index -> turns remaining
-        self._destroyed_rooms: set = set()
+        self._any_active = 0  # _ACTIVE_* bits for effects that need per-turn processing
+        self._doomed_heroes: Set[Hero] = set()  # expiry turn lives on hero._doom_expiry
+        # (room_id, enemy index) -> expiry turn
+        self._charmed_enemies: Dict[Tuple[int, int], int] = {}
+        self._charm_bits: Dict[int, int] = {}  # room_id -> bitmask of charmed enemy indices
+        # One min-heap of (expiry_turn, seq, kind, key) for dooms and charms; kind is an
+        # _ACTIVE_* bit and seq breaks ties. Entries superseded by a newer expiry are skipped.
+        self._expiry_heap: List[Tuple[int, int, int, Any]] = []
+        self._expiry_seq = itertools.count()
+        # One byte per room id (ids are dense from 0), nonzero once the room has collapsed
+        self._destroyed_rooms = bytearray(max(dungeon.rooms, default=-1) + 1)
+        # Rooms still standing, kept in a list for O(1) random picks; updated on collapse
+        self._live_rooms: List[int] = list(dungeon.rooms.keys())
+        self._live_room_index: Dict[int, int] = {rid: i for i, rid in enumerate(self._live_rooms)}
+        
+        # Effective per-power cost/suspicion, rebuilt only when dark blessing toggles
+        self._eff_cost: List[int] = [0] * len(PowerId)
+        self._eff_susp: List[int] = [0] * len(PowerId)
+        self._rebuild_effective_tables()
+    
+    def _rebuild_effective_tables(self):
+        """Recompute effective costs and suspicion for the current dark blessing state."""
+        blessed = self._dark_blessing_remaining > 0
+        for pid, (cost, suspicion, _, is_ultimate) in enumerate(self._POWER_TABLE):
+            if blessed:
+                # Reduced cost (except ultimates) and suspicion during dark blessing
+                self._eff_cost[pid] = cost if is_ultimate else (cost * 3) >> 2
+                self._eff_susp[pid] = suspicion >> 1
+            else:
+                self._eff_cost[pid] = cost
+                self._eff_susp[pid] = suspicion
     
     def advance_turn(self):
         """Advance the turn counter and process ongoing effects."""
         self.current_turn += 1
-        self._process_doom_effects()
-        self._process_charm_decay()
+        active = self._any_active
+        if not active:
+            return
         
-        if self._time_freeze_remaining > 0:
+        if active & (_ACTIVE_DOOM | _ACTIVE_CHARM):
+            self._process_expirations()
+        
+        if active & _ACTIVE_FREEZE:
             self._time_freeze_remaining -= 1
-        if self._dark_blessing_remaining > 0:
+            if self._time_freeze_remaining <= 0:
+                self._any_active &= ~_ACTIVE_FREEZE
+        if active & _ACTIVE_BLESSING:
             self._dark_blessing_remaining -= 1
-    
-    def _process_doom_effects(self):
-        """Process doom countdowns."""
-        expired = []
-        for hero_id, turns in self._doom_targets.items():
-            self._doom_targets[hero_id] = turns - 1
-            if self._doom_targets[hero_id] <= 0:
-                expired.append(hero_id)
+            if self._dark_blessing_remaining <= 0:
+                self._any_active &= ~_ACTIVE_BLESSING
+                self._rebuild_effective_tables()
+    
+    def _process_expirations(self):
+        """Trigger dooms and release charms whose expiry turn has been reached."""
+        heap = self._expiry_heap
+        turn = self.current_turn
+        while heap and heap[0][0] <= turn:
+            expiry, _, kind, key = heapq.heappop(heap)
+            if kind == _ACTIVE_DOOM:
+                hero = key
+                if hero not in self._doomed_heroes or hero._doom_expiry != expiry:
+                    continue
+                self._doomed_heroes.discard(hero)
+                hero._doom_expiry = None
                 self.event_bus.publish(Event(
                     EventType.PLAYER_ACTION,
-                    {"action": "doom_triggered", "hero_id": hero_id}
+                    {"action": "doom_triggered", "hero_id": id(hero)}
                 ))
-        for hero_id in expired:
-            del self._doom_targets[hero_id]
-    
-    def _process_charm_decay(self):
-        """Process charmed enemy duration decay."""
-        expired = []
-        for enemy_key, turns in self._charmed_enemies.items():
-            self._charmed_enemies[enemy_key] = turns - 1
-            if self._charmed_enemies[enemy_key] <= 0:
-                expired.append(enemy_key)
-        for key in expired:
-            del self._charmed_enemies[key]
+            else:
+                if self._charmed_enemies.get(key) != expiry:
+                    continue
+                del self._charmed_enemies[key]
+                room_id, enemy_idx = key
+                bits = self._charm_bits[room_id] & ~(1 << enemy_idx)
+                if bits:
+                    self._charm_bits[room_id] = bits
+                else:
+                    del self._charm_bits[room_id]
+        
+        if not self._doomed_heroes:
+            self._any_active &= ~_ACTIVE_DOOM
+        if not self._charmed_enemies:
+            self._any_active &= ~_ACTIVE_CHARM
+        if not self._any_active & (_ACTIVE_DOOM | _ACTIVE_CHARM):
+            heap.clear()  # Only stale entries can remain
+    
+    def _schedule_expiry(self, expiry: int, kind: int, key: Any):
+        """Queue a doom or charm expiry."""
+        heapq.heappush(self._expiry_heap, (expiry, next(self._expiry_seq), kind, key))
+    
+    def hasten_doom(self, turns: int):
+        """
+        Bring every pending doom closer by a number of turns.
+        A doom is never moved earlier than the next turn.
+        
+        Args:
+            turns: Number of turns to subtract from each countdown
+        """
+        for hero in self._doomed_heroes:
+            hero._doom_expiry = max(self.current_turn + 1, hero._doom_expiry - turns)
+            self._schedule_expiry(hero._doom_expiry, _ACTIVE_DOOM, hero)
     
     def regenerate_energy(self, amount: int = 10):
         """Regenerate curse energy."""
@@ -129,49 +240,32 @@ class AdvancedCursePowers:
         Returns:
             True if power can be used, False otherwise
         """
-        if power_name not in self.POWERS:
+        power_id = self._NAME_TO_ID.get(power_name)
+        if power_id is None:
             return False
         
-        power = self.POWERS[power_name]
-        
-        # Check energy
-        if self.curse_energy < power.energy_cost:
-            return False
-        
-        # Check cooldown
-        if power_name in self._cooldowns:
-            if self.current_turn < self._cooldowns[power_name]:
-                return False
-        
-        return True
+        return (
+            self.curse_energy >= self._POWER_TABLE[power_id][0]
+            and self.current_turn >= self._cooldowns[power_id]
+        )
     
-    def _apply_cost_and_cooldown(self, power_name: str) -> bool:
+    def _apply_cost_and_cooldown(self, power_id: PowerId) -> bool:
         """Apply energy cost and set cooldown for a power."""
-        if not self.is_power_available(power_name):
+        cost, _, cooldown, _ = self._POWER_TABLE[power_id]
+        if self.curse_energy < cost or self.current_turn < self._cooldowns[power_id]:
             return False
         
-        power = self.POWERS[power_name]
-        cost = power.energy_cost
-        
-        # Dark blessing doubles effects but also costs
-        if self._dark_blessing_remaining > 0 and power.tier != CursePowerTier.ULTIMATE:
-            cost = int(cost * 0.75)  # Reduced cost during dark blessing
-        
-        self.curse_energy -= cost
+        self.curse_energy -= self._eff_cost[power_id]
         self.actions_taken += 1
         
-        if power.cooldown > 0:
-            self._cooldowns[power_name] = self.current_turn + power.cooldown
+        if cooldown > 0:
+            self._cooldowns[power_id] = self.current_turn + cooldown
         
         return True
     
-    def _get_suspicion_amount(self, power_name: str) -> int:
+    def _get_suspicion_amount(self, power_id: PowerId) -> int:
         """Get suspicion increase for a power, modified by dark blessing."""
-        power = self.POWERS[power_name]
-        suspicion = power.suspicion_increase
-        if self._dark_blessing_remaining > 0:
-            suspicion = int(suspicion * 0.5)  # Reduced suspicion during dark blessing
-        return suspicion
+        return self._eff_susp[power_id]
     
     # === Basic Powers ===
     
@@ -186,7 +280,7 @@ class AdvancedCursePowers:
         Returns:
             True if successful, False otherwise
         """
-        if not self._apply_cost_and_cooldown("trigger_trap"):
+        if not self._apply_cost_and_cooldown(PowerId.TRIGGER_TRAP):
             return False
         
         room = self.dungeon.get_room(room_id)
@@ -217,18 +311,20 @@ class AdvancedCursePowers:
         if not room or room.altered:
             return False
         
-        if not self._apply_cost_and_cooldown("alter_room"):
+        if not self._apply_cost_and_cooldown(PowerId.ALTER_ROOM):
             return False
         
         room.alter_room()
         
-        self.event_bus.publish(Event(
-            EventType.ROOM_ALTERED,
-            {"room": room_id, "type": room.room_type.value}
-        ))
-        self.event_bus.publish(Event(
-            EventType.PLAYER_ACTION,
-            {"action": "alter_room", "room": room_id}
+        self.event_bus.publish_many((
+            Event(
+                EventType.ROOM_ALTERED,
+                {"room": room_id, "type": room.room_type.value}
+            ),
+            Event(
+                EventType.PLAYER_ACTION,
+                {"action": "alter_room", "room": room_id}
+            ),
         ))
         return True
     
@@ -247,19 +343,21 @@ class AdvancedCursePowers:
         if not room or item_index >= len(room.items):
             return False
         
-        if not self._apply_cost_and_cooldown("corrupt_loot"):
+        if not self._apply_cost_and_cooldown(PowerId.CORRUPT_LOOT):
             return False
         
         item = room.items[item_index]
         item.corrupt()
         
-        self.event_bus.publish(Event(
-            EventType.ITEM_CORRUPTED,
-            {"item": item.name, "room": room_id, "quality": item.quality.value}
-        ))
-        self.event_bus.publish(Event(
-            EventType.PLAYER_ACTION,
-            {"action": "corrupt_loot", "room": room_id, "item": item.name}
+        self.event_bus.publish_many((
+            Event(
+                EventType.ITEM_CORRUPTED,
+                {"item": item.name, "room": room_id, "quality": item.quality.value}
+            ),
+            Event(
+                EventType.PLAYER_ACTION,
+                {"action": "corrupt_loot", "room": room_id, "item": item.name}
+            ),
         ))
         return True
     
@@ -282,23 +380,25 @@ class AdvancedCursePowers:
         if enemy.is_mutated or not enemy.is_alive:
             return False
         
-        if not self._apply_cost_and_cooldown("mutate_enemy"):
+        if not self._apply_cost_and_cooldown(PowerId.MUTATE_ENEMY):
             return False
         
         enemy.mutate()
         
         # Dark blessing doubles mutation effects
         if self._dark_blessing_remaining > 0:
-            enemy.attack = int(enemy.attack * 1.25)
-            enemy.defense = int(enemy.defense * 1.25)
-        
-        self.event_bus.publish(Event(
-            EventType.ENEMY_MUTATED,
-            {"enemy": enemy.name, "room": room_id}
-        ))
-        self.event_bus.publish(Event(
-            EventType.PLAYER_ACTION,
-            {"action": "mutate_enemy", "room": room_id, "enemy": enemy.name}
+            enemy.attack = (enemy.attack * 5) >> 2
+            enemy.defense = (enemy.defense * 5) >> 2
+        
+        self.event_bus.publish_many((
+            Event(
+                EventType.ENEMY_MUTATED,
+                {"enemy": enemy.name, "room": room_id}
+            ),
+            Event(
+                EventType.PLAYER_ACTION,
+                {"action": "mutate_enemy", "room": room_id, "enemy": enemy.name}
+            ),
         ))
         return True
     
@@ -318,23 +418,25 @@ class AdvancedCursePowers:
         if not room:
             return False
         
-        if not self._apply_cost_and_cooldown("spawn_trap"):
+        if not self._apply_cost_and_cooldown(PowerId.SPAWN_TRAP):
             return False
         
         # Dark blessing increases trap damage
         if self._dark_blessing_remaining > 0:
-            damage = int(damage * 1.5)
+            damage = (damage * 3) >> 1
         
         trap = Trap(trap_type, damage)
         room.add_trap(trap)
         
-        self.event_bus.publish(Event(
-            EventType.TRAP_PLACED,
-            {"trap": trap_type.value, "room": room_id, "damage": damage}
-        ))
-        self.event_bus.publish(Event(
-            EventType.PLAYER_ACTION,
-            {"action": "spawn_trap", "room": room_id, "trap": trap_type.value}
+        self.event_bus.publish_many((
+            Event(
+                EventType.TRAP_PLACED,
+                {"trap": trap_type.value, "room": room_id, "damage": damage}
+            ),
+            Event(
+                EventType.PLAYER_ACTION,
+                {"action": "spawn_trap", "room": room_id, "trap": trap_type.value}
+            ),
         ))
         return True
     
@@ -351,31 +453,34 @@ class AdvancedCursePowers:
         Returns:
             True if successful, False otherwise
         """
-        if not self._apply_cost_and_cooldown("teleport_hero"):
+        if not self._apply_cost_and_cooldown(PowerId.TELEPORT_HERO):
             return False
         
-        # Get all valid room IDs excluding destroyed rooms
-        valid_rooms = [
-            rid for rid in self.dungeon.rooms.keys()
-            if rid not in self._destroyed_rooms and rid != hero.current_room_id
-        ]
-        
-        if not valid_rooms:
+        # Pick uniformly among live rooms other than the hero's current one
+        live_rooms = self._live_rooms
+        current_idx = self._live_room_index.get(hero.current_room_id)
+        num_choices = len(live_rooms) - (current_idx is not None)
+        if num_choices <= 0:
             return False
         
-        target_room = random.choice(valid_rooms)
+        idx = self._rng.randrange(num_choices)
+        if current_idx is not None and idx >= current_idx:
+            idx += 1
+        target_room = live_rooms[idx]
         old_room = hero.current_room_id
         hero.current_room_id = target_room
         
-        hero.increase_suspicion(self._get_suspicion_amount("teleport_hero"))
-        
-        self.event_bus.publish(Event(
-            EventType.HERO_MOVED,
-            {"from": old_room, "to": target_room, "teleported": True}
-        ))
-        self.event_bus.publish(Event(
-            EventType.PLAYER_ACTION,
-            {"action": "teleport_hero", "from": old_room, "to": target_room}
+        hero.increase_suspicion(self._get_suspicion_amount(PowerId.TELEPORT_HERO))
+        
+        self.event_bus.publish_many((
+            Event(
+                EventType.HERO_MOVED,
+                {"from": old_room, "to": target_room, "teleported": True}
+            ),
+            Event(
+                EventType.PLAYER_ACTION,
+                {"action": "teleport_hero", "from": old_room, "to": target_room}
+            ),
         ))
         return True
     
@@ -392,19 +497,22 @@ class AdvancedCursePowers:
             True if successful, False otherwise
         """
         room = self.dungeon.get_room(room_id)
-        if not room or enemy_idx >= len(room.enemies):
+        if not room or not 0 <= enemy_idx < len(room.enemies):
             return False
         
         enemy = room.enemies[enemy_idx]
         if not enemy.is_alive:
             return False
         
-        if not self._apply_cost_and_cooldown("charm_enemy"):
+        if not self._apply_cost_and_cooldown(PowerId.CHARM_ENEMY):
             return False
         
-        charm_key = room_id * 1000 + enemy_idx
         charm_duration = 5 if self._dark_blessing_remaining > 0 else 3
-        self._charmed_enemies[charm_key] = charm_duration
+        expiry = self.current_turn + charm_duration
+        self._charmed_enemies[(room_id, enemy_idx)] = expiry
+        self._charm_bits[room_id] = self._charm_bits.get(room_id, 0) | (1 << enemy_idx)
+        self._schedule_expiry(expiry, _ACTIVE_CHARM, (room_id, enemy_idx))
+        self._any_active |= _ACTIVE_CHARM
         
         self.event_bus.publish(Event(
             EventType.PLAYER_ACTION,
@@ -414,8 +522,7 @@ class AdvancedCursePowers:
     
     def is_enemy_charmed(self, room_id: int, enemy_idx: int) -> bool:
         """Check if an enemy is currently charmed."""
-        charm_key = room_id * 1000 + enemy_idx
-        return charm_key in self._charmed_enemies
+        return enemy_idx >= 0 and bool(self._charm_bits.get(room_id, 0) & (1 << enemy_idx))
     
     def time_freeze(self, duration: int) -> bool:
         """
@@ -429,7 +536,7 @@ class AdvancedCursePowers:
         """
         duration = min(duration, 3)  # Cap at 3 turns
         
-        if not self._apply_cost_and_cooldown("time_freeze"):
+        if not self._apply_cost_and_cooldown(PowerId.TIME_FREEZE):
             return False
         
         # Dark blessing increases freeze duration
@@ -437,6 +544,8 @@ class AdvancedCursePowers:
             duration = min(duration + 1, 4)
         
         self._time_freeze_remaining = duration
+        if duration > 0:
+            self._any_active |= _ACTIVE_FREEZE
         
         self.event_bus.publish(Event(
             EventType.PLAYER_ACTION,
@@ -462,7 +571,7 @@ class AdvancedCursePowers:
         if not room or not room.items:
             return False
         
-        if not self._apply_cost_and_cooldown("mass_corruption"):
+        if not self._apply_cost_and_cooldown(PowerId.MASS_CORRUPTION):
             return False
         
         corrupted_items = []
@@ -491,42 +600,40 @@ class AdvancedCursePowers:
             True if successful, False otherwise
         """
         room = self.dungeon.get_room(room_id)
-        if not room or room_id in self._destroyed_rooms:
+        if not room or self.is_room_destroyed(room_id):
             return False
         
-        if not self._apply_cost_and_cooldown("summon_enemy"):
+        if not self._apply_cost_and_cooldown(PowerId.SUMMON_ENEMY):
             return False
         
         enemy = self._create_enemy(enemy_type)
         
         # Dark blessing creates stronger enemies
         if self._dark_blessing_remaining > 0:
-            enemy.health = int(enemy.health * 1.3)
-            enemy.max_health = int(enemy.max_health * 1.3)
-            enemy.attack = int(enemy.attack * 1.2)
+            enemy.health = enemy.health * 13 // 10
+            enemy.max_health = enemy.max_health * 13 // 10
+            enemy.attack = enemy.attack * 6 // 5
         
         room.add_enemy(enemy)
         
-        self.event_bus.publish(Event(
-            EventType.ENEMY_SPAWNED,
-            {"enemy": enemy.name, "room": room_id, "type": enemy_type.value}
-        ))
-        self.event_bus.publish(Event(
-            EventType.PLAYER_ACTION,
-            {"action": "summon_enemy", "room": room_id, "enemy_type": enemy_type.value}
+        self.event_bus.publish_many((
+            Event(
+                EventType.ENEMY_SPAWNED,
+                {"enemy": enemy.name, "room": room_id, "type": enemy_type.value}
+            ),
+            Event(
+                EventType.PLAYER_ACTION,
+                {"action": "summon_enemy", "room": room_id, "enemy_type": enemy_type.value}
+            ),
         ))
         return True
     
     def _create_enemy(self, enemy_type: EnemyType) -> Enemy:
         """Create an enemy of the specified type."""
-        if enemy_type == EnemyType.GOBLIN:
-            return Enemy(EnemyType.GOBLIN, "Summoned Goblin", 30, 8, 2)
-        elif enemy_type == EnemyType.ORC:
-            return Enemy(EnemyType.ORC, "Summoned Orc", 50, 12, 5)
-        elif enemy_type == EnemyType.SKELETON:
-            return Enemy(EnemyType.SKELETON, "Summoned Skeleton", 40, 10, 3)
-        else:
-            return Enemy(EnemyType.DRAGON, "Summoned Dragon", 150, 25, 10)
+        prototype = self._ENEMY_PROTOTYPES.get(enemy_type)
+        if prototype is None:
+            prototype = self._ENEMY_PROTOTYPES[EnemyType.DRAGON]
+        return copy.copy(prototype)
     
     # === Ultimate Powers ===
     
@@ -544,13 +651,16 @@ class AdvancedCursePowers:
         if not hero.is_alive:
             return False
         
-        if not self._apply_cost_and_cooldown("doom"):
+        if not self._apply_cost_and_cooldown(PowerId.DOOM):
             return False
         
         doom_turns = 5
-        self._doom_targets[id(hero)] = doom_turns
+        hero._doom_expiry = self.current_turn + doom_turns
+        self._doomed_heroes.add(hero)
+        self._schedule_expiry(hero._doom_expiry, _ACTIVE_DOOM, hero)
+        self._any_active |= _ACTIVE_DOOM
         
-        hero.increase_suspicion(self._get_suspicion_amount("doom"))
+        hero.increase_suspicion(self._get_suspicion_amount(PowerId.DOOM))
         
         self.event_bus.publish(Event(
             EventType.PLAYER_ACTION,
@@ -568,7 +678,9 @@ class AdvancedCursePowers:
         Returns:
             Turns remaining if doomed, None otherwise
         """
-        return self._doom_targets.get(id(hero))
+        if hero not in self._doomed_heroes:
+            return None
+        return hero._doom_expiry - self.current_turn
     
     def dark_blessing(self) -> bool:
         """
@@ -578,10 +690,12 @@ class AdvancedCursePowers:
         Returns:
             True if successful, False otherwise
         """
-        if not self._apply_cost_and_cooldown("dark_blessing"):
+        if not self._apply_cost_and_cooldown(PowerId.DARK_BLESSING):
             return False
         
         self._dark_blessing_remaining = 5
+        self._any_active |= _ACTIVE_BLESSING
+        self._rebuild_effective_tables()
         
         self.event_bus.publish(Event(
             EventType.PLAYER_ACTION,
@@ -606,14 +720,14 @@ class AdvancedCursePowers:
             True if successful, False otherwise
         """
         room = self.dungeon.get_room(room_id)
-        if not room or room_id in self._destroyed_rooms:
+        if not room or self.is_room_destroyed(room_id):
             return False
         
         # Can't destroy entrance or boss room
         if room_id == 0 or room_id == len(self.dungeon.rooms) - 1:
             return False
         
-        if not self._apply_cost_and_cooldown("dungeon_collapse"):
+        if not self._apply_cost_and_cooldown(PowerId.DUNGEON_COLLAPSE):
             return False
         
         damage = 40 if self._dark_blessing_remaining > 0 else 30
@@ -625,8 +739,12 @@ class AdvancedCursePowers:
             if room.connected_rooms and hero.is_alive:
                 hero.current_room_id = room.connected_rooms[0]
         
-        # Mark room as destroyed
-        self._destroyed_rooms.add(room_id)
+        # Mark room as destroyed, growing the bitmap for rooms added after creation
+        destroyed = self._destroyed_rooms
+        if room_id >= len(destroyed):
+            destroyed.extend(bytes(room_id + 1 - len(destroyed)))
+        destroyed[room_id] = 1
+        self._remove_live_room(room_id)
         
         # Remove connections to this room
         for connected_id in room.connected_rooms:
@@ -636,7 +754,7 @@ class AdvancedCursePowers:
         
         room.connected_rooms.clear()
         
-        hero.increase_suspicion(self._get_suspicion_amount("dungeon_collapse"))
+        hero.increase_suspicion(self._get_suspicion_amount(PowerId.DUNGEON_COLLAPSE))
         
         self.event_bus.publish(Event(
             EventType.PLAYER_ACTION,
@@ -644,9 +762,19 @@ class AdvancedCursePowers:
         ))
         return True
     
+    def _remove_live_room(self, room_id: int):
+        """Swap-remove a room from the live room list."""
+        idx = self._live_room_index.pop(room_id, None)
+        if idx is None:
+            return
+        last = self._live_rooms.pop()
+        if last != room_id:
+            self._live_rooms[idx] = last
+            self._live_room_index[last] = idx
+    
     def is_room_destroyed(self, room_id: int) -> bool:
         """Check if a room has been destroyed."""
-        return room_id in self._destroyed_rooms
+        return 0 <= room_id < len(self._destroyed_rooms) and bool(self._destroyed_rooms[room_id])
     
     def get_cooldown_remaining(self, power_name: str) -> int:
         """
@@ -658,9 +786,10 @@ class AdvancedCursePowers:
         Returns:
             Turns remaining, 0 if ready
         """
-        if power_name not in self._cooldowns:
+        power_id = self._NAME_TO_ID.get(power_name)
+        if power_id is None:
             return 0
-        return max(0, self._cooldowns[power_name] - self.current_turn)
+        return max(0, self._cooldowns[power_id] - self.current_turn)
     
     def __repr__(self):
         blessing = " [DARK BLESSING]" if self._dark_blessing_remaining > 0 else ""
@@ -2,21 +2,29 @@
 Behavior Tree implementation for AI decision-making.
 Provides a flexible framework for the hero AI to make intelligent decisions.
 """
-from enum import Enum
-from typing import Any, Callable, List, Optional
+from enum import IntEnum
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from abc import ABC, abstractmethod
 
 
-class NodeStatus(Enum):
+class NodeStatus(IntEnum):
     """Status of a behavior tree node"""
-    SUCCESS = "success"
-    FAILURE = "failure"
-    RUNNING = "running"
+    SUCCESS = 0
+    FAILURE = 1
+    RUNNING = 2
+
+
+# Module-level aliases so hot tick loops skip the class attribute lookup
+_SUCCESS = NodeStatus.SUCCESS
+_FAILURE = NodeStatus.FAILURE
+_RUNNING = NodeStatus.RUNNING
 
 
 class BehaviorNode(ABC):
     """Base class for all behavior tree nodes"""
     
+    __slots__ = ("name",)
+    
     def __init__(self, name: str):
         self.name = name
     
@@ -27,7 +35,14 @@ class BehaviorNode(ABC):
 
 
 class ActionNode(BehaviorNode):
-    """Leaf node that performs an action"""
+    """
+    Leaf node that performs an action.
+    
+    The action must return a NodeStatus; BehaviorTree.tick raises TypeError
+    for any other value.
+    """
+    
+    __slots__ = ("action",)
     
     def __init__(self, name: str, action: Callable[[Any], NodeStatus]):
         super().__init__(name)
@@ -40,53 +55,67 @@ class ActionNode(BehaviorNode):
 class ConditionNode(BehaviorNode):
     """Leaf node that checks a condition"""
     
+    __slots__ = ("condition",)
+    
     def __init__(self, name: str, condition: Callable[[Any], bool]):
         super().__init__(name)
         self.condition = condition
     
     def tick(self, context: Any) -> NodeStatus:
-        return NodeStatus.SUCCESS if self.condition(context) else NodeStatus.FAILURE
+        return _SUCCESS if self.condition(context) else _FAILURE
 
 
 class SequenceNode(BehaviorNode):
     """Composite node that executes children in sequence until one fails"""
     
+    __slots__ = ("children", "_child_ticks")
+    
     def __init__(self, name: str, children: Optional[List[BehaviorNode]] = None):
         super().__init__(name)
         self.children = children or []
+        # Bound child tick methods, kept in step with children by add_child
+        self._child_ticks = tuple(child.tick for child in self.children)
     
     def add_child(self, child: BehaviorNode):
         self.children.append(child)
+        self._child_ticks += (child.tick,)
     
     def tick(self, context: Any) -> NodeStatus:
-        for child in self.children:
-            status = child.tick(context)
-            if status != NodeStatus.SUCCESS:
+        for child_tick in self._child_ticks:
+            status = child_tick(context)
+            if status:  # anything but SUCCESS (0)
                 return status
-        return NodeStatus.SUCCESS
+        return _SUCCESS
 
 
 class SelectorNode(BehaviorNode):
     """Composite node that executes children until one succeeds"""
     
+    __slots__ = ("children", "_child_ticks")
+    
     def __init__(self, name: str, children: Optional[List[BehaviorNode]] = None):
         super().__init__(name)
         self.children = children or []
+        # Bound child tick methods, kept in step with children by add_child
+        self._child_ticks = tuple(child.tick for child in self.children)
     
     def add_child(self, child: BehaviorNode):
         self.children.append(child)
+        self._child_ticks += (child.tick,)
     
     def tick(self, context: Any) -> NodeStatus:
-        for child in self.children:
-            status = child.tick(context)
-            if status != NodeStatus.FAILURE:
+        for child_tick in self._child_ticks:
+            status = child_tick(context)
+            if status != _FAILURE:
                 return status
-        return NodeStatus.FAILURE
+        return _FAILURE
 
 
 class DecoratorNode(BehaviorNode):
     """Node that modifies the behavior of a child node"""
     
+    __slots__ = ("child",)
+    
     def __init__(self, name: str, child: BehaviorNode):
         super().__init__(name)
         self.child = child
@@ -99,18 +128,22 @@ class DecoratorNode(BehaviorNode):
 class InverterNode(DecoratorNode):
     """Inverts the result of its child"""
     
+    __slots__ = ()
+    
     def tick(self, context: Any) -> NodeStatus:
         status = self.child.tick(context)
-        if status == NodeStatus.SUCCESS:
-            return NodeStatus.FAILURE
-        elif status == NodeStatus.FAILURE:
-            return NodeStatus.SUCCESS
+        if status == _SUCCESS:
+            return _FAILURE
+        elif status == _FAILURE:
+            return _SUCCESS
         return status
 
 
 class RepeaterNode(DecoratorNode):
     """Repeats its child a specified number of times"""
     
+    __slots__ = ("times",)
+    
     def __init__(self, name: str, child: BehaviorNode, times: int):
         super().__init__(name, child)
         self.times = times
@@ -118,17 +151,123 @@ class RepeaterNode(DecoratorNode):
     def tick(self, context: Any) -> NodeStatus:
         for _ in range(self.times):
             status = self.child.tick(context)
-            if status == NodeStatus.FAILURE:
-                return NodeStatus.FAILURE
-        return NodeStatus.SUCCESS
+            if status == _FAILURE:
+                return _FAILURE
+        return _SUCCESS
+
+
+_STATUS_BY_CODE = (_SUCCESS, _FAILURE, _RUNNING)
+
+# Opcodes of a compiled program
+OP_ACTION = 0     # call returns a NodeStatus
+OP_CONDITION = 1  # call returns a bool
 
 
 class BehaviorTree:
     """Main behavior tree class"""
     
+    __slots__ = (
+        "root", "_prog", "_jumps", "_entry",
+        "_memo_version", "_memo_result", "_version"
+    )
+    
     def __init__(self, root: BehaviorNode):
         self.root = root
+        self._version = 0
+        self.compile()
+    
+    def compile(self):
+        """
+        Lower the tree into a flat program of (opcode, callable, slot) instructions.
+        
+        Each instruction has a parallel jump entry (on_success, on_failure, on_running)
+        indexed by NodeStatus value. Non-negative targets are program counters;
+        a negative target ``~status`` halts with that status. Sequence, selector
+        and inverter nodes are folded away into jumps; any other node is kept as
+        a single call to its own tick(). Call this again after changing the
+        tree's structure.
+        
+        Conditions sharing the same callable share a memo slot, so a check that
+        appears in several branches runs once per tick until an action runs.
+        """
+        self._prog: List[Tuple[int, Callable[[Any], Any], int]] = []
+        self._jumps: List[Tuple[int, int, int]] = []
+        slots: Dict[Callable[[Any], Any], int] = {}
+        self._entry = self._lower(self.root, ~_SUCCESS, ~_FAILURE, ~_RUNNING, slots)
+        self._memo_version = [-1] * len(slots)
+        self._memo_result = [_FAILURE] * len(slots)
+    
+    def _lower(
+        self,
+        node: BehaviorNode,
+        on_success: int,
+        on_failure: int,
+        on_running: int,
+        slots: Dict[Callable[[Any], Any], int]
+    ) -> int:
+        """Emit instructions for a node and return its entry point"""
+        node_type = type(node)
+        if node_type is SequenceNode:
+            entry = on_success
+            for child in reversed(node.children):
+                entry = self._lower(child, entry, on_failure, on_running, slots)
+            return entry
+        if node_type is SelectorNode:
+            entry = on_failure
+            for child in reversed(node.children):
+                entry = self._lower(child, on_success, entry, on_running, slots)
+            return entry
+        if node_type is InverterNode:
+            return self._lower(node.child, on_failure, on_success, on_running, slots)
+        
+        if node_type is ConditionNode:
+            slot = slots.setdefault(node.condition, len(slots))
+            self._prog.append((OP_CONDITION, node.condition, slot))
+        elif node_type is ActionNode:
+            self._prog.append((OP_ACTION, node.action, -1))
+        else:
+            self._prog.append((OP_ACTION, node.tick, -1))
+        self._jumps.append((on_success, on_failure, on_running))
+        return len(self._prog) - 1
     
     def tick(self, context: Any) -> NodeStatus:
-        """Execute the behavior tree"""
-        return self.root.tick(context)
+        """
+        Execute the behavior tree.
+        
+        Args:
+            context: Passed to every action and condition.
+            
+        Returns:
+            The status of the root node.
+            
+        Raises:
+            TypeError: If an action or custom node returns something other
+                than a NodeStatus.
+        """
+        prog = self._prog
+        jumps = self._jumps
+        memo_version = self._memo_version
+        memo_result = self._memo_result
+        # A memoized condition result is valid only while the version is unchanged
+        version = self._version + 1
+        pc = self._entry
+        while pc >= 0:
+            op, fn, slot = prog[pc]
+            if op == OP_CONDITION:
+                if memo_version[slot] == version:
+                    status = memo_result[slot]
+                else:
+                    status = _SUCCESS if fn(context) else _FAILURE
+                    memo_version[slot] = version
+                    memo_result[slot] = status
+            else:
+                status = fn(context)
+                if type(status) is not NodeStatus:
+                    raise TypeError(
+                        f"{getattr(fn, '__qualname__', fn)!r} returned {status!r}, "
+                        "expected a NodeStatus"
+                    )
+                version += 1  # Actions may change what conditions observe
+            pc = jumps[pc][status]
+        self._version = version
+        return _STATUS_BY_CODE[~pc]
@@ -27,9 +27,10 @@ def main():
     # Build command
     print("\nBuilding executable...")
     
+    # --onedir avoids the self-extraction to a temp dir that --onefile does on every launch
     cmd = [
         sys.executable, "-m", "PyInstaller",
-        "--onefile",
+        "--onedir",
         "--name", "DungeonCrawlerAI",
         "--console",  # Keep console for text-based game
         "main_enhanced.py"
@@ -39,25 +40,35 @@ def main():
     if os.path.exists("icon.ico"):
         cmd.extend(["--icon", "icon.ico"])
 
+    # Compress bundled binaries with UPX if available
+    upx_path = shutil.which("upx")
+    if upx_path:
+        cmd.extend(["--upx-dir", os.path.dirname(upx_path)])
+        print(f"✓ UPX found: {upx_path}")
+
     try:
         subprocess.check_call(cmd)
         print("\n✓ Build successful!")
         
         # Check output
-        exe_path = os.path.join("dist", "DungeonCrawlerAI.exe")
+        bundle_dir = os.path.join("dist", "DungeonCrawlerAI")
+        exe_path = os.path.join(bundle_dir, "DungeonCrawlerAI.exe")
         if os.path.exists(exe_path):
-            size_mb = os.path.getsize(exe_path) / (1024 * 1024)
+            size_mb = sum(
+                os.path.getsize(os.path.join(root, name))
+                for root, _, files in os.walk(bundle_dir)
+                for name in files
+            ) / (1024 * 1024)
             print(f"\n  Output: {exe_path}")
             print(f"  Size: {size_mb:.1f} MB")
             
-            # Create release folder
+            # Create release folder from the bundle directory
             release_dir = "release"
             if os.path.exists(release_dir):
                 shutil.rmtree(release_dir)
-            os.makedirs(release_dir)
+            shutil.copytree(bundle_dir, release_dir)
             
             # Copy files
-            shutil.copy(exe_path, release_dir)
             shutil.copy("README.md", release_dir)
             if os.path.exists("README_ENHANCED.md"):
                 shutil.copy("README_ENHANCED.md", release_dir)
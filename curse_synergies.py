@@ -2,22 +2,30 @@
 Curse Synergies/Combos for DungeonCrawlerAI.
 Tracks power sequences and rewards strategic combinations with bonus effects.
 """
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from types import MappingProxyType
+from typing import Deque, List, Dict, Mapping, Optional, Tuple
 
 from advanced_curse_powers import AdvancedCursePowers
 from events import EventBus, Event, EventType
 
 
-@dataclass
+@dataclass(slots=True)
 class CurseSynergy:
     """Represents a synergy between curse powers."""
     name: str
     description: str
-    powers_required: List[str]
+    powers_required: Tuple[str, ...]
     bonus_effect: str
     energy_discount: int
     suspicion_modifier: float
+    _discount_frac: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Freeze the power sequence and precompute the energy refund fraction."""
+        self.powers_required = tuple(self.powers_required)
+        self._discount_frac = self.energy_discount / 100
 
 
 CORRUPTION_CHAIN = CurseSynergy(
@@ -84,6 +92,91 @@ ALL_SYNERGIES = [
 ]
 
 
+def _build_synergy_automaton(synergies: List[CurseSynergy]) -> Tuple[
+    Dict[str, int], List[Dict[int, int]], List[Optional[CurseSynergy]]
+]:
+    """
+    Build an Aho-Corasick automaton over the synergies' power sequences.
+
+    Power names are interned to ints and the goto function is completed with
+    the failure links, so each tracked power is a single dict lookup.
+
+    Args:
+        synergies: Synergies to match, in priority order
+
+    Returns:
+        Tuple of (power ids, transitions, match synergy per node)
+    """
+    power_ids: Dict[str, int] = {}
+    children: List[Dict[int, int]] = [{}]
+    match_synergy: List[Optional[CurseSynergy]] = [None]
+
+    for synergy in synergies:
+        node = 0
+        for power in synergy.powers_required:
+            pid = power_ids.setdefault(power, len(power_ids))
+            child = children[node].get(pid)
+            if child is None:
+                child = len(children)
+                children[node][pid] = child
+                children.append({})
+                match_synergy.append(None)
+            node = child
+        if match_synergy[node] is None:
+            match_synergy[node] = synergy
+
+    transitions: List[Dict[int, int]] = [dict(c) for c in children]
+    fail = [0] * len(children)
+    queue = deque(children[0].values())
+    while queue:
+        node = queue.popleft()
+        # A node without its own synergy reports the longest one ending here.
+        if match_synergy[node] is None:
+            match_synergy[node] = match_synergy[fail[node]]
+        for pid, target in transitions[fail[node]].items():
+            transitions[node].setdefault(pid, target)
+        for pid, child in children[node].items():
+            if node:
+                fail[child] = transitions[fail[node]].get(pid, 0)
+            queue.append(child)
+
+    return power_ids, transitions, match_synergy
+
+
+_POWER_IDS, _TRANSITIONS, _MATCH_SYNERGY = _build_synergy_automaton(ALL_SYNERGIES)
+
+# First required power -> synergies starting with it, for pruning progress checks.
+_SYNERGIES_BY_FIRST_POWER: Dict[str, List[CurseSynergy]] = {}
+for _synergy in ALL_SYNERGIES:
+    if _synergy.powers_required:
+        _SYNERGIES_BY_FIRST_POWER.setdefault(_synergy.powers_required[0], []).append(_synergy)
+del _synergy
+_MAX_SYNERGY_LENGTH = max(len(s.powers_required) for s in ALL_SYNERGIES)
+
+
+def _no_effect(curse: AdvancedCursePowers) -> None:
+    """Synergy with no effect beyond its energy refund."""
+
+
+def _apply_trap_gauntlet(curse: AdvancedCursePowers) -> None:
+    """Raise every trap's damage by 50%."""
+    for room in curse.dungeon.rooms.values():
+        for trap in room.traps:
+            trap.damage = (trap.damage * 3) >> 1
+
+
+def _apply_doom_combo(curse: AdvancedCursePowers) -> None:
+    """Bring every pending doom two turns closer."""
+    curse.hasten_doom(2)
+
+
+# Synergy name -> bonus effect; synergies not listed only refund energy.
+_SYNERGY_EFFECTS = {
+    TRAP_GAUNTLET.name: _apply_trap_gauntlet,
+    DOOM_COMBO.name: _apply_doom_combo,
+}
+
+
 class SynergyTracker:
     """
     Tracks recently used powers and detects when synergies are triggered.
@@ -98,22 +191,40 @@ class SynergyTracker:
             event_bus: Optional event bus for publishing synergy events
             max_history: Maximum number of recent powers to track
         """
-        self.recent_powers: List[str] = []
+        self.recent_powers: Deque[str] = deque(maxlen=max_history)
         self.active_synergies: List[CurseSynergy] = []
-        self._max_history = max_history
         self._event_bus = event_bus
         self._synergy_count: Dict[str, int] = {}
+        self._synergy_count_view = MappingProxyType(self._synergy_count)
+        self._state = 0
+        self._tracked = 0
+        # Matched synergies awaiting a check, with the tracked count at their last power
+        self._pending: Deque[Tuple[CurseSynergy, int]] = deque()
     
     def track_power(self, power_name: str) -> None:
         """
         Add a power to the recent powers list.
         
+        Advances the synergy automaton; a completed sequence is queued for
+        the next check_synergies call, which consumes its powers.
+        
         Args:
             power_name: Name of the power that was used
         """
         self.recent_powers.append(power_name)
-        if len(self.recent_powers) > self._max_history:
-            self.recent_powers.pop(0)
+        self._tracked += 1
+        self._advance(power_name, self._tracked)
+    
+    def _advance(self, power_name: str, tracked: int) -> None:
+        """Feed one power to the automaton, queueing any completed synergy."""
+        pid = _POWER_IDS.get(power_name)
+        self._state = _TRANSITIONS[self._state].get(pid, 0) if pid is not None else 0
+        synergy = _MATCH_SYNERGY[self._state]
+        # A sequence longer than the history window can never be held in it
+        if synergy is not None and len(synergy.powers_required) <= self.recent_powers.maxlen:
+            # The matched powers are reserved for this synergy; start afresh after them
+            self._pending.append((synergy, tracked))
+            self._state = 0
     
     def check_synergies(self) -> Optional[CurseSynergy]:
         """
@@ -122,58 +233,112 @@ class SynergyTracker:
         Returns:
             The triggered CurseSynergy if found, None otherwise
         """
-        for synergy in ALL_SYNERGIES:
-            if self._matches_synergy(synergy):
-                self.active_synergies.append(synergy)
-                self._synergy_count[synergy.name] = self._synergy_count.get(synergy.name, 0) + 1
-                
-                if self._event_bus:
-                    self._event_bus.publish(Event(
-                        EventType.PLAYER_ACTION,
-                        {
-                            "action": "synergy_triggered",
-                            "synergy": synergy.name,
-                            "bonus": synergy.bonus_effect
-                        }
-                    ))
-                
-                self._clear_matched_powers(synergy)
-                return synergy
-        
-        return None
+        synergy = self._next_synergy()
+        if synergy and self._event_bus:
+            self._event_bus.publish(self._triggered_event(synergy))
+        return synergy
     
-    def _matches_synergy(self, synergy: CurseSynergy) -> bool:
+    def check_and_apply_synergies(
+        self,
+        curse: Optional[AdvancedCursePowers]
+    ) -> Optional[CurseSynergy]:
         """
-        Check if recent powers contain the required sequence for a synergy.
+        Check for a triggered synergy and apply its bonus in one step.
+        
+        The triggered and applied events are published together. Without a
+        curse this behaves like check_synergies.
         
         Args:
-            synergy: The synergy to check against
+            curse: The AdvancedCursePowers instance to modify, if any
             
         Returns:
-            True if the synergy sequence is present in recent powers
+            The triggered CurseSynergy if found, None otherwise
         """
-        required = synergy.powers_required
-        if len(self.recent_powers) < len(required):
-            return False
+        if curse is None:
+            return self.check_synergies()
         
-        for i in range(len(self.recent_powers) - len(required) + 1):
-            if self.recent_powers[i:i + len(required)] == required:
-                return True
+        synergy = self._next_synergy()
+        if synergy:
+            energy_refund = self._apply_bonus(synergy, curse)
+            if self._event_bus:
+                self._event_bus.publish_many((
+                    self._triggered_event(synergy),
+                    self._applied_event(synergy, energy_refund),
+                ))
+        return synergy
+    
+    def _next_synergy(self) -> Optional[CurseSynergy]:
+        """
+        Pop the next pending synergy still inside the history window.
         
-        return False
+        Matches whose first power has rolled out of recent powers are
+        dropped, as the sequence is no longer there to trigger.
+        """
+        while self._pending:
+            synergy, end = self._pending.popleft()
+            if self._clear_matched_powers(synergy, end):
+                self.active_synergies.append(synergy)
+                self._synergy_count[synergy.name] = self._synergy_count.get(synergy.name, 0) + 1
+                return synergy
+        return None
+    
+    @staticmethod
+    def _triggered_event(synergy: CurseSynergy) -> Event:
+        """Build the event announcing a triggered synergy."""
+        return Event(
+            EventType.PLAYER_ACTION,
+            {
+                "action": "synergy_triggered",
+                "synergy": synergy.name,
+                "bonus": synergy.bonus_effect
+            }
+        )
+    
+    @staticmethod
+    def _applied_event(synergy: CurseSynergy, energy_refund: int) -> Event:
+        """Build the event reporting an applied synergy bonus."""
+        return Event(
+            EventType.PLAYER_ACTION,
+            {
+                "action": "synergy_applied",
+                "synergy": synergy.name,
+                "energy_refund": energy_refund
+            }
+        )
     
-    def _clear_matched_powers(self, synergy: CurseSynergy) -> None:
+    def _clear_matched_powers(self, synergy: CurseSynergy, end: int) -> bool:
         """
-        Remove the matched power sequence from recent powers.
+        Remove a matched power sequence from recent powers.
+        
+        A match that has partly rolled out of the history is left alone.
+        Once no other match is pending, the automaton is rebuilt from the
+        powers left at the end of the history, so sequences that now join
+        across the removed powers are still detected.
         
         Args:
             synergy: The synergy that was matched
+            end: Tracked power count when the synergy's last power was used
+            
+        Returns:
+            True if the whole sequence was still in recent powers
         """
-        required = synergy.powers_required
-        for i in range(len(self.recent_powers) - len(required) + 1):
-            if self.recent_powers[i:i + len(required)] == required:
-                del self.recent_powers[i:i + len(required)]
-                return
+        recent = self.recent_powers
+        stop = len(recent) - (self._tracked - end)
+        start = stop - len(synergy.powers_required)
+        in_window = start >= 0
+        if in_window:
+            for _ in range(stop - start):
+                del recent[start]
+        else:
+            start = 0
+        
+        if self._pending:
+            return in_window
+        self._state = 0
+        first = len(recent) - self._tracked
+        for i in range(max(start - (_MAX_SYNERGY_LENGTH - 1), 0), len(recent)):
+            self._advance(recent[i], i - first + 1)
+        return in_window
     
     def apply_synergy_bonus(self, synergy: CurseSynergy, curse: AdvancedCursePowers) -> None:
         """
@@ -183,39 +348,19 @@ class SynergyTracker:
             synergy: The synergy to apply
             curse: The AdvancedCursePowers instance to modify
         """
-        energy_refund = int(curse.max_curse_energy * (synergy.energy_discount / 100))
-        curse.curse_energy = min(curse.max_curse_energy, curse.curse_energy + energy_refund)
-        
-        if synergy.name == "Corruption Chain":
-            pass
-        
-        elif synergy.name == "Trap Gauntlet":
-            for room in curse.dungeon.rooms.values():
-                for trap in room.traps:
-                    trap.damage = int(trap.damage * 1.5)
-        
-        elif synergy.name == "Mutation Surge":
-            pass
-        
-        elif synergy.name == "Doom Combo":
-            for hero_id in list(curse._doom_targets.keys()):
-                curse._doom_targets[hero_id] = max(1, curse._doom_targets[hero_id] - 2)
-        
-        elif synergy.name == "Dark Ritual":
-            pass
-        
-        elif synergy.name == "Chaos Storm":
-            pass
-        
+        energy_refund = self._apply_bonus(synergy, curse)
         if self._event_bus:
-            self._event_bus.publish(Event(
-                EventType.PLAYER_ACTION,
-                {
-                    "action": "synergy_applied",
-                    "synergy": synergy.name,
-                    "energy_refund": energy_refund
-                }
-            ))
+            self._event_bus.publish(self._applied_event(synergy, energy_refund))
+    
+    @staticmethod
+    def _apply_bonus(synergy: CurseSynergy, curse: AdvancedCursePowers) -> int:
+        """Refund energy and run the synergy's effect, returning the refund."""
+        max_energy = curse.max_curse_energy
+        energy_refund = int(max_energy * synergy._discount_frac)
+        curse.curse_energy = min(max_energy, curse.curse_energy + energy_refund)
+        
+        _SYNERGY_EFFECTS.get(synergy.name, _no_effect)(curse)
+        return energy_refund
     
     def get_progress_toward_synergies(self) -> Dict[str, Dict]:
         """
@@ -223,44 +368,37 @@ class SynergyTracker:
         
         Returns:
             Dictionary mapping synergy names to progress info:
-            - 'required': List of required powers
-            - 'matched': Number of consecutive powers matched from start
+            - 'required': Tuple of required powers
+            - 'matched': Number of leading powers the recent history ends with
             - 'percentage': Completion percentage (0-100)
         """
-        progress = {}
+        progress = {
+            synergy.name: {
+                "required": synergy.powers_required,
+                "matched": 0,
+                "percentage": 0,
+                "next_power": synergy.powers_required[0] if synergy.powers_required else None
+            }
+            for synergy in ALL_SYNERGIES
+        }
+        recent = self.recent_powers
         
-        for synergy in ALL_SYNERGIES:
-            required = synergy.powers_required
-            matched = 0
-            
-            for i, power in enumerate(required):
-                if i < len(self.recent_powers) and self.recent_powers[-(len(required) - i):]:
-                    check_idx = len(self.recent_powers) - (len(required) - i)
-                    if check_idx >= 0 and check_idx < len(self.recent_powers):
-                        if self.recent_powers[check_idx] == power:
-                            matched += 1
-                        else:
-                            break
-                    else:
+        # Only a synergy whose first power appears in the last few powers can
+        # have progress; try the oldest such start first to find the longest prefix.
+        for count in range(min(len(recent), _MAX_SYNERGY_LENGTH), 0, -1):
+            for synergy in _SYNERGIES_BY_FIRST_POWER.get(recent[-count], ()):
+                required = synergy.powers_required
+                length = len(required)
+                info = progress[synergy.name]
+                if count > length or info["matched"]:
+                    continue
+                for i in range(1, count):
+                    if recent[i - count] != required[i]:
                         break
                 else:
-                    break
-            
-            tail_matched = 0
-            for i in range(min(len(self.recent_powers), len(required))):
-                tail_start = len(self.recent_powers) - i - 1
-                if tail_start >= 0 and self.recent_powers[tail_start:] == required[:i + 1]:
-                    tail_matched = i + 1
-            
-            matched = tail_matched
-            percentage = int((matched / len(required)) * 100) if required else 0
-            
-            progress[synergy.name] = {
-                "required": required,
-                "matched": matched,
-                "percentage": percentage,
-                "next_power": required[matched] if matched < len(required) else None
-            }
+                    info["matched"] = count
+                    info["percentage"] = int((count / length) * 100)
+                    info["next_power"] = required[count] if count < length else None
         
         return progress
     
@@ -268,14 +406,23 @@ class SynergyTracker:
         """Clear all active synergies."""
         self.active_synergies.clear()
     
-    def get_synergy_stats(self) -> Dict[str, int]:
+    def get_synergy_stats(self) -> Mapping[str, int]:
         """
         Get statistics on synergy usage.
         
+        Returns:
+            Read-only live view mapping synergy names to times triggered
+        """
+        return self._synergy_count_view
+    
+    def get_synergy_stats_snapshot(self) -> Dict[str, int]:
+        """
+        Get a copy of the synergy usage statistics.
+        
         Returns:
             Dictionary mapping synergy names to times triggered
         """
-        return self._synergy_count.copy()
+        return dict(self._synergy_count)
     
     def __repr__(self) -> str:
         active = [s.name for s in self.active_synergies]
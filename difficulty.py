@@ -1,7 +1,8 @@
 """Difficulty system for DungeonCrawlerAI."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
+from fractions import Fraction
 
 
 class Difficulty(Enum):
@@ -12,7 +13,20 @@ class Difficulty(Enum):
     NIGHTMARE = auto()
 
 
-@dataclass(frozen=True)
+def _ratio(multiplier: float) -> tuple[int, int]:
+    """Convert a decimal multiplier to an exact integer ratio.
+    
+    Args:
+        multiplier: Multiplier as written in the presets, e.g. 1.2.
+        
+    Returns:
+        (numerator, denominator) so values scale as value * num // den.
+    """
+    fraction = Fraction(str(multiplier))
+    return fraction.numerator, fraction.denominator
+
+
+@dataclass(frozen=True, slots=True)
 class DifficultySettings:
     """Settings that vary based on difficulty level.
     
@@ -24,6 +38,10 @@ class DifficultySettings:
         enemy_damage_multiplier: Multiplier applied to enemy damage.
         trap_damage_multiplier: Multiplier applied to trap damage.
         starting_curse_energy: Initial curse energy at game start.
+        hero_hp_ratio: hero_hp_multiplier as an exact (numerator, denominator).
+        hero_attack_ratio: hero_attack_multiplier as an exact (numerator, denominator).
+        enemy_damage_ratio: enemy_damage_multiplier as an exact (numerator, denominator).
+        trap_damage_ratio: trap_damage_multiplier as an exact (numerator, denominator).
     """
     hero_hp_multiplier: float
     hero_attack_multiplier: float
@@ -32,6 +50,17 @@ class DifficultySettings:
     enemy_damage_multiplier: float
     trap_damage_multiplier: float
     starting_curse_energy: int
+    hero_hp_ratio: tuple[int, int] = field(init=False, repr=False, compare=False)
+    hero_attack_ratio: tuple[int, int] = field(init=False, repr=False, compare=False)
+    enemy_damage_ratio: tuple[int, int] = field(init=False, repr=False, compare=False)
+    trap_damage_ratio: tuple[int, int] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Derive the exact integer ratios from the float multipliers."""
+        object.__setattr__(self, "hero_hp_ratio", _ratio(self.hero_hp_multiplier))
+        object.__setattr__(self, "hero_attack_ratio", _ratio(self.hero_attack_multiplier))
+        object.__setattr__(self, "enemy_damage_ratio", _ratio(self.enemy_damage_multiplier))
+        object.__setattr__(self, "trap_damage_ratio", _ratio(self.trap_damage_multiplier))
 
 
 DIFFICULTY_PRESETS: dict[Difficulty, DifficultySettings] = {
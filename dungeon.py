@@ -6,13 +6,51 @@ import random
 from typing import List, Optional, Dict
 from models import Room, RoomType, Item, ItemType, Enemy, EnemyType, Trap, TrapType
 
+# Bound once so room population skips the module attribute lookups.
+_random = random.random
+_randint = random.randint
+_choice = random.choice
+
+# Enemy type -> (name, health, attack, defense)
+_ENEMY_TEMPLATES = {
+    EnemyType.GOBLIN: ("Goblin", 30, 8, 2),
+    EnemyType.ORC: ("Orc", 50, 12, 5),
+    EnemyType.SKELETON: ("Skeleton", 40, 10, 3),
+    EnemyType.DRAGON: ("Dragon", 150, 25, 10),
+}
+
+_TRAP_TYPES = tuple(TrapType)
+_WEAK_ENEMIES = (EnemyType.GOBLIN, EnemyType.ORC, EnemyType.SKELETON)
+_STRONG_ENEMIES = (EnemyType.ORC, EnemyType.SKELETON)
+
+# Random room items as (item type, name, (min value, max value)), picked uniformly
+_ITEM_TEMPLATES = (
+    (ItemType.HEALTH_POTION, "Health Potion", (20, 40)),
+    (ItemType.WEAPON, "Sword", (3, 8)),
+    (ItemType.ARMOR, "Shield", (2, 5)),
+    (ItemType.TREASURE, "Coins", (10, 50)),
+)
+
 
 class Dungeon:
     """Represents the dungeon structure"""
     
-    def __init__(self, num_rooms: int = 10):
+    def __init__(self, num_rooms: int = 10, seed: Optional[int] = None):
+        """
+        Generate a new dungeon.
+        
+        Args:
+            num_rooms: Total number of rooms, including entrance, treasure and boss
+            seed: Optional seed for a private generator so the layout is reproducible;
+                the shared random module state is used when omitted
+        """
         if num_rooms < 3:
             raise ValueError(f"Dungeon requires at least 3 rooms (entrance, treasure, boss), got {num_rooms}")
+        if seed is None:
+            self._random, self._randint, self._choice = _random, _randint, _choice
+        else:
+            rng = random.Random(seed)
+            self._random, self._randint, self._choice = rng.random, rng.randint, rng.choice
         self.rooms: Dict[int, Room] = {}
         self.num_rooms = num_rooms
         self.entrance_room_id = 0
@@ -48,40 +86,40 @@ class Dungeon:
     def _populate_room(self, room: Room):
         """Populate a normal room with enemies, items, and traps"""
         # Add enemies (50% chance)
-        if random.random() < 0.5:
-            num_enemies = random.randint(1, 2)
+        if self._random() < 0.5:
+            num_enemies = self._randint(1, 2)
             for _ in range(num_enemies):
-                enemy_type = random.choice([EnemyType.GOBLIN, EnemyType.ORC, EnemyType.SKELETON])
+                enemy_type = self._choice(_WEAK_ENEMIES)
                 enemy = self._create_enemy(enemy_type)
                 room.add_enemy(enemy)
         
         # Add items (40% chance)
-        if random.random() < 0.4:
+        if self._random() < 0.4:
             item = self._create_random_item()
             room.add_item(item)
         
         # Add traps (30% chance)
-        if random.random() < 0.3:
-            trap_type = random.choice(list(TrapType))
-            trap = Trap(trap_type, random.randint(5, 15))
+        if self._random() < 0.3:
+            trap_type = self._choice(_TRAP_TYPES)
+            trap = Trap(trap_type, self._randint(5, 15))
             room.add_trap(trap)
     
     def _populate_treasure_room(self, room: Room):
         """Populate treasure room with valuable items"""
         # Add multiple treasures
-        for _ in range(random.randint(2, 4)):
-            treasure = Item(ItemType.TREASURE, "Gold Coins", random.randint(50, 150))
+        for _ in range(self._randint(2, 4)):
+            treasure = Item(ItemType.TREASURE, "Gold Coins", self._randint(50, 150))
             room.add_item(treasure)
         
         # Add good equipment
-        weapon = Item(ItemType.WEAPON, "Enchanted Sword", random.randint(10, 20))
-        armor = Item(ItemType.ARMOR, "Sturdy Armor", random.randint(5, 10))
+        weapon = Item(ItemType.WEAPON, "Enchanted Sword", self._randint(10, 20))
+        armor = Item(ItemType.ARMOR, "Sturdy Armor", self._randint(5, 10))
         room.add_item(weapon)
         room.add_item(armor)
         
         # But also some enemies guarding it
         for _ in range(2):
-            enemy = self._create_enemy(random.choice([EnemyType.ORC, EnemyType.SKELETON]))
+            enemy = self._create_enemy(self._choice(_STRONG_ENEMIES))
             room.add_enemy(enemy)
     
     def _populate_boss_room(self, room: Room):
@@ -91,46 +129,35 @@ class Dungeon:
         
         # Boss room treasure
         for _ in range(3):
-            treasure = Item(ItemType.TREASURE, "Dragon Hoard", random.randint(100, 200))
+            treasure = Item(ItemType.TREASURE, "Dragon Hoard", self._randint(100, 200))
             room.add_item(treasure)
     
     def _create_enemy(self, enemy_type: EnemyType) -> Enemy:
         """Create an enemy of the specified type"""
-        if enemy_type == EnemyType.GOBLIN:
-            return Enemy(EnemyType.GOBLIN, "Goblin", 30, 8, 2)
-        elif enemy_type == EnemyType.ORC:
-            return Enemy(EnemyType.ORC, "Orc", 50, 12, 5)
-        elif enemy_type == EnemyType.SKELETON:
-            return Enemy(EnemyType.SKELETON, "Skeleton", 40, 10, 3)
-        else:
-            return Enemy(EnemyType.DRAGON, "Dragon", 150, 25, 10)
+        stats = _ENEMY_TEMPLATES.get(enemy_type)
+        if stats is None:
+            enemy_type, stats = EnemyType.DRAGON, _ENEMY_TEMPLATES[EnemyType.DRAGON]
+        return Enemy(enemy_type, *stats)
     
     def _create_random_item(self) -> Item:
         """Create a random item"""
-        item_choice = random.choice([ItemType.HEALTH_POTION, ItemType.WEAPON, ItemType.ARMOR, ItemType.TREASURE])
-        
-        if item_choice == ItemType.HEALTH_POTION:
-            return Item(ItemType.HEALTH_POTION, "Health Potion", random.randint(20, 40))
-        elif item_choice == ItemType.WEAPON:
-            return Item(ItemType.WEAPON, "Sword", random.randint(3, 8))
-        elif item_choice == ItemType.ARMOR:
-            return Item(ItemType.ARMOR, "Shield", random.randint(2, 5))
-        else:
-            return Item(ItemType.TREASURE, "Coins", random.randint(10, 50))
+        item_type, name, value_range = self._choice(_ITEM_TEMPLATES)
+        return Item(item_type, name, self._randint(*value_range))
     
     def _connect_rooms(self):
         """Connect rooms to create a dungeon layout"""
+        rooms = self.rooms
         # Create a main path from entrance to boss
         for i in range(self.num_rooms - 1):
-            self.rooms[i].connected_rooms.append(i + 1)
-            self.rooms[i + 1].connected_rooms.append(i)
+            rooms[i].connected_rooms.append(i + 1)
+            rooms[i + 1].connected_rooms.append(i)
         
-        # Add some additional connections for branches
-        for i in range(1, self.num_rooms - 2):
-            if random.random() < 0.3 and i + 2 < self.num_rooms - 1:
-                if i + 2 not in self.rooms[i].connected_rooms:
-                    self.rooms[i].connected_rooms.append(i + 2)
-                    self.rooms[i + 2].connected_rooms.append(i)
+        # Add some additional connections for branches. Each i -> i + 2 edge is
+        # only ever considered once, so no duplicate check is needed.
+        for i in range(1, self.num_rooms - 3):
+            if self._random() < 0.3:
+                rooms[i].connected_rooms.append(i + 2)
+                rooms[i + 2].connected_rooms.append(i)
     
     def get_room(self, room_id: int) -> Optional[Room]:
         """Get a room by ID"""
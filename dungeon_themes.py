@@ -4,8 +4,9 @@ Defines themed dungeon configurations with unique enemies, traps, and mechanics.
 """
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import List, Dict
+from typing import Dict, List, Tuple
 import random
+import sys
 
 from models import Enemy, EnemyType, Trap, TrapType, Room, RoomType, Item, ItemType
 from dungeon import Dungeon
@@ -54,31 +55,31 @@ class ExtendedTrapType(Enum):
     VOID = "void"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ThemeConfig:
     """Configuration for a dungeon theme.
     
     Attributes:
         name: Display name of the theme.
         description: Flavor text describing the theme.
-        enemy_types: List of enemy types that spawn in this theme.
-        trap_types: List of trap types that appear in this theme.
+        enemy_types: Enemy types that spawn in this theme.
+        trap_types: Trap types that appear in this theme.
         room_count_range: Tuple of (min, max) room counts.
         enemy_stats_modifier: Multiplier for enemy stats.
         trap_damage_modifier: Multiplier for trap damage.
-        special_mechanics: List of special mechanics active in this theme.
-        atmosphere_events: List of atmospheric events that can occur.
+        special_mechanics: Special mechanics active in this theme.
+        atmosphere_events: Atmospheric events that can occur.
         color_scheme: Dictionary of colors for potential UI rendering.
     """
     name: str
     description: str
-    enemy_types: List[ExtendedEnemyType]
-    trap_types: List[ExtendedTrapType]
-    room_count_range: tuple
+    enemy_types: Tuple[ExtendedEnemyType, ...]
+    trap_types: Tuple[ExtendedTrapType, ...]
+    room_count_range: Tuple[int, int]
     enemy_stats_modifier: float
     trap_damage_modifier: float
-    special_mechanics: List[str] = field(default_factory=list)
-    atmosphere_events: List[str] = field(default_factory=list)
+    special_mechanics: Tuple[str, ...] = ()
+    atmosphere_events: Tuple[str, ...] = ()
     color_scheme: Dict[str, str] = field(default_factory=dict)
 
 
@@ -86,73 +87,73 @@ THEME_CONFIGS: Dict[DungeonTheme, ThemeConfig] = {
     DungeonTheme.CLASSIC_FANTASY: ThemeConfig(
         name="Classic Fantasy Dungeon",
         description="A traditional dungeon filled with goblins, orcs, and ancient traps.",
-        enemy_types=[ExtendedEnemyType.GOBLIN, ExtendedEnemyType.ORC, ExtendedEnemyType.SKELETON],
-        trap_types=[ExtendedTrapType.SPIKE, ExtendedTrapType.ARROW, ExtendedTrapType.POISON],
+        enemy_types=(ExtendedEnemyType.GOBLIN, ExtendedEnemyType.ORC, ExtendedEnemyType.SKELETON),
+        trap_types=(ExtendedTrapType.SPIKE, ExtendedTrapType.ARROW, ExtendedTrapType.POISON),
         room_count_range=(8, 12),
         enemy_stats_modifier=1.0,
         trap_damage_modifier=1.0,
-        special_mechanics=["standard_combat", "loot_drops"],
-        atmosphere_events=["torch_flickers", "distant_footsteps", "dripping_water"],
+        special_mechanics=("standard_combat", "loot_drops"),
+        atmosphere_events=("torch_flickers", "distant_footsteps", "dripping_water"),
         color_scheme={"primary": "#8B4513", "secondary": "#DAA520", "accent": "#CD853F"}
     ),
     DungeonTheme.UNDEAD_CRYPT: ThemeConfig(
         name="Undead Crypt",
         description="An ancient burial ground where the dead refuse to stay dead.",
-        enemy_types=[ExtendedEnemyType.SKELETON, ExtendedEnemyType.WRAITH],
-        trap_types=[ExtendedTrapType.POISON, ExtendedTrapType.CURSE],
+        enemy_types=(ExtendedEnemyType.SKELETON, ExtendedEnemyType.WRAITH),
+        trap_types=(ExtendedTrapType.POISON, ExtendedTrapType.CURSE),
         room_count_range=(10, 15),
         enemy_stats_modifier=0.9,
         trap_damage_modifier=1.2,
-        special_mechanics=["enemy_respawn", "curse_stacking", "life_drain"],
-        atmosphere_events=["ghostly_whispers", "bones_rattling", "cold_draft", "grave_mist"],
+        special_mechanics=("enemy_respawn", "curse_stacking", "life_drain"),
+        atmosphere_events=("ghostly_whispers", "bones_rattling", "cold_draft", "grave_mist"),
         color_scheme={"primary": "#2F4F4F", "secondary": "#708090", "accent": "#9932CC"}
     ),
     DungeonTheme.TECHNOLOGICAL: ThemeConfig(
         name="Technological Facility",
         description="An abandoned high-tech facility with malfunctioning robots and security systems.",
-        enemy_types=[ExtendedEnemyType.ROBOT, ExtendedEnemyType.TURRET],
-        trap_types=[ExtendedTrapType.LASER, ExtendedTrapType.EXPLOSION],
+        enemy_types=(ExtendedEnemyType.ROBOT, ExtendedEnemyType.TURRET),
+        trap_types=(ExtendedTrapType.LASER, ExtendedTrapType.EXPLOSION),
         room_count_range=(8, 14),
         enemy_stats_modifier=1.1,
         trap_damage_modifier=1.3,
-        special_mechanics=["energy_shields", "emp_vulnerability", "hacking"],
-        atmosphere_events=["sparking_wires", "alarm_beeping", "servo_whirring", "power_fluctuation"],
+        special_mechanics=("energy_shields", "emp_vulnerability", "hacking"),
+        atmosphere_events=("sparking_wires", "alarm_beeping", "servo_whirring", "power_fluctuation"),
         color_scheme={"primary": "#1C1C1C", "secondary": "#00CED1", "accent": "#FF4500"}
     ),
     DungeonTheme.VOLCANIC: ThemeConfig(
         name="Volcanic Depths",
         description="A scorching cavern system flowing with molten lava.",
-        enemy_types=[ExtendedEnemyType.FIRE_ELEMENTAL, ExtendedEnemyType.LAVA_GOLEM],
-        trap_types=[ExtendedTrapType.FIRE, ExtendedTrapType.LAVA],
+        enemy_types=(ExtendedEnemyType.FIRE_ELEMENTAL, ExtendedEnemyType.LAVA_GOLEM),
+        trap_types=(ExtendedTrapType.FIRE, ExtendedTrapType.LAVA),
         room_count_range=(6, 10),
         enemy_stats_modifier=1.2,
         trap_damage_modifier=1.5,
-        special_mechanics=["fire_damage_bonus", "heat_damage_over_time", "lava_pools"],
-        atmosphere_events=["ground_tremor", "lava_bubbling", "heat_wave", "sulfur_smell"],
+        special_mechanics=("fire_damage_bonus", "heat_damage_over_time", "lava_pools"),
+        atmosphere_events=("ground_tremor", "lava_bubbling", "heat_wave", "sulfur_smell"),
         color_scheme={"primary": "#8B0000", "secondary": "#FF4500", "accent": "#FFD700"}
     ),
     DungeonTheme.ICE_CAVERN: ThemeConfig(
         name="Ice Cavern",
         description="A frozen labyrinth where the cold seeps into your bones.",
-        enemy_types=[ExtendedEnemyType.FROST_WRAITH, ExtendedEnemyType.ICE_GOLEM],
-        trap_types=[ExtendedTrapType.ICE, ExtendedTrapType.FREEZE],
+        enemy_types=(ExtendedEnemyType.FROST_WRAITH, ExtendedEnemyType.ICE_GOLEM),
+        trap_types=(ExtendedTrapType.ICE, ExtendedTrapType.FREEZE),
         room_count_range=(7, 11),
         enemy_stats_modifier=1.0,
         trap_damage_modifier=1.1,
-        special_mechanics=["slowed_movement", "shatter_mechanic", "frozen_enemies", "hypothermia"],
-        atmosphere_events=["howling_wind", "ice_cracking", "breath_visible", "icicles_falling"],
+        special_mechanics=("slowed_movement", "shatter_mechanic", "frozen_enemies", "hypothermia"),
+        atmosphere_events=("howling_wind", "ice_cracking", "breath_visible", "icicles_falling"),
         color_scheme={"primary": "#E0FFFF", "secondary": "#00BFFF", "accent": "#4169E1"}
     ),
     DungeonTheme.ELDRITCH_HORROR: ThemeConfig(
         name="Eldritch Dimension",
         description="A realm of chaos where reality bends and madness lurks in shadows.",
-        enemy_types=[ExtendedEnemyType.VOID_SPAWN, ExtendedEnemyType.MIND_FLAYER],
-        trap_types=[ExtendedTrapType.MADNESS, ExtendedTrapType.VOID],
+        enemy_types=(ExtendedEnemyType.VOID_SPAWN, ExtendedEnemyType.MIND_FLAYER),
+        trap_types=(ExtendedTrapType.MADNESS, ExtendedTrapType.VOID),
         room_count_range=(9, 16),
         enemy_stats_modifier=1.3,
         trap_damage_modifier=1.0,
-        special_mechanics=["sanity_system", "random_stat_changes", "reality_warp", "tentacle_grab"],
-        atmosphere_events=["reality_flicker", "whispers_in_mind", "impossible_geometry", "eyes_watching"],
+        special_mechanics=("sanity_system", "random_stat_changes", "reality_warp", "tentacle_grab"),
+        atmosphere_events=("reality_flicker", "whispers_in_mind", "impossible_geometry", "eyes_watching"),
         color_scheme={"primary": "#4B0082", "secondary": "#8A2BE2", "accent": "#00FF00"}
     ),
 }
@@ -191,6 +192,47 @@ TRAP_BASE_DAMAGE: Dict[ExtendedTrapType, int] = {
 }
 
 
+# Closest core type for each extended type, used for AI and combat behavior.
+_CORE_ENEMY_TYPES: Dict[ExtendedEnemyType, EnemyType] = {
+    ExtendedEnemyType.GOBLIN: EnemyType.GOBLIN,
+    ExtendedEnemyType.ORC: EnemyType.ORC,
+    ExtendedEnemyType.SKELETON: EnemyType.SKELETON,
+    ExtendedEnemyType.DRAGON: EnemyType.DRAGON,
+    ExtendedEnemyType.WRAITH: EnemyType.SKELETON,
+    ExtendedEnemyType.ROBOT: EnemyType.ORC,
+    ExtendedEnemyType.TURRET: EnemyType.GOBLIN,
+    ExtendedEnemyType.FIRE_ELEMENTAL: EnemyType.DRAGON,
+    ExtendedEnemyType.LAVA_GOLEM: EnemyType.ORC,
+    ExtendedEnemyType.FROST_WRAITH: EnemyType.SKELETON,
+    ExtendedEnemyType.ICE_GOLEM: EnemyType.ORC,
+    ExtendedEnemyType.VOID_SPAWN: EnemyType.SKELETON,
+    ExtendedEnemyType.MIND_FLAYER: EnemyType.DRAGON,
+}
+
+
+_CORE_TRAP_TYPES: Dict[ExtendedTrapType, TrapType] = {
+    ExtendedTrapType.SPIKE: TrapType.SPIKE,
+    ExtendedTrapType.POISON: TrapType.POISON,
+    ExtendedTrapType.ARROW: TrapType.ARROW,
+    ExtendedTrapType.FIRE: TrapType.FIRE,
+    ExtendedTrapType.CURSE: TrapType.POISON,
+    ExtendedTrapType.LASER: TrapType.ARROW,
+    ExtendedTrapType.EXPLOSION: TrapType.FIRE,
+    ExtendedTrapType.LAVA: TrapType.FIRE,
+    ExtendedTrapType.ICE: TrapType.SPIKE,
+    ExtendedTrapType.FREEZE: TrapType.POISON,
+    ExtendedTrapType.MADNESS: TrapType.POISON,
+    ExtendedTrapType.VOID: TrapType.FIRE,
+}
+
+
+# Display name for each extended enemy type, interned so every spawn shares one string.
+_ENEMY_DISPLAY_NAMES: Dict[ExtendedEnemyType, str] = {
+    enemy_type: sys.intern(enemy_type.value.replace("_", " ").title())
+    for enemy_type in ExtendedEnemyType
+}
+
+
 def get_theme_config(theme: DungeonTheme) -> ThemeConfig:
     """Get the configuration for a specific dungeon theme.
     
@@ -203,36 +245,44 @@ def get_theme_config(theme: DungeonTheme) -> ThemeConfig:
     Raises:
         KeyError: If the theme is not found in configurations.
     """
-    if theme not in THEME_CONFIGS:
-        raise KeyError(f"Theme {theme} not found in configurations")
-    return THEME_CONFIGS[theme]
+    try:
+        return THEME_CONFIGS[theme]
+    except KeyError:
+        raise KeyError(f"Theme {theme} not found in configurations") from None
 
 
 def apply_theme_to_dungeon(dungeon: Dungeon, theme: DungeonTheme) -> None:
     """Apply a theme to an existing dungeon, modifying its contents.
     
     Replaces enemies and traps with theme-appropriate versions and applies
-    stat modifiers based on the theme configuration.
+    stat modifiers based on the theme configuration. Does nothing if the
+    dungeon already has this theme applied.
     
     Args:
         dungeon: The dungeon to apply the theme to.
         theme: The theme to apply.
     """
+    if getattr(dungeon, "theme", None) is theme:
+        return
+    
     config = get_theme_config(theme)
+    enemy_rows = _THEME_ENEMY_TABLE[theme]
+    trap_rows = _THEME_TRAP_TABLE[theme]
+    choices = random.choices
+    randint = random.randint
+    make_enemy = Enemy
+    make_trap = Trap
     
-    for room_id, room in dungeon.rooms.items():
+    for room in dungeon.rooms.values():
         if room.room_type == RoomType.ENTRANCE:
             continue
-            
-        themed_enemies = []
-        for _ in room.enemies:
-            themed_enemies.append(create_themed_enemy(theme))
-        room.enemies = themed_enemies
         
-        themed_traps = []
-        for _ in room.traps:
-            themed_traps.append(create_themed_trap(theme))
-        room.traps = themed_traps
+        # Draw each room's picks in one batch rather than one choice() per spawn.
+        room.enemies = [make_enemy(*row) for row in choices(enemy_rows, k=len(room.enemies))]
+        room.traps = [
+            make_trap(core_type, randint(low, high) if low > 0 else max(1, randint(low, high)))
+            for core_type, low, high in choices(trap_rows, k=len(room.traps))
+        ]
     
     dungeon.theme = theme
     dungeon.theme_config = config
@@ -250,20 +300,7 @@ def create_themed_enemy(theme: DungeonTheme) -> Enemy:
     Returns:
         A new Enemy instance with theme-appropriate stats.
     """
-    config = get_theme_config(theme)
-    enemy_type = random.choice(config.enemy_types)
-    stats = ENEMY_STATS[enemy_type]
-    
-    modifier = config.enemy_stats_modifier
-    health = int(stats["health"] * modifier)
-    attack = int(stats["attack"] * modifier)
-    defense = int(stats["defense"] * modifier)
-    
-    name = enemy_type.value.replace("_", " ").title()
-    
-    core_type = _map_to_core_enemy_type(enemy_type)
-    
-    return Enemy(core_type, name, health, attack, defense)
+    return Enemy(*random.choice(_THEME_ENEMY_TABLE[theme]))
 
 
 def create_themed_trap(theme: DungeonTheme) -> Trap:
@@ -278,17 +315,9 @@ def create_themed_trap(theme: DungeonTheme) -> Trap:
     Returns:
         A new Trap instance with theme-appropriate damage.
     """
-    config = get_theme_config(theme)
-    trap_type = random.choice(config.trap_types)
-    base_damage = TRAP_BASE_DAMAGE[trap_type]
-    
-    damage = int(base_damage * config.trap_damage_modifier)
-    damage += random.randint(-3, 5)
-    damage = max(1, damage)
-    
-    core_type = _map_to_core_trap_type(trap_type)
-    
-    return Trap(core_type, damage)
+    core_type, low, high = random.choice(_THEME_TRAP_TABLE[theme])
+    damage = random.randint(low, high)
+    return Trap(core_type, damage if low > 0 else max(1, damage))
 
 
 def _map_to_core_enemy_type(extended_type: ExtendedEnemyType) -> EnemyType:
@@ -300,22 +329,7 @@ def _map_to_core_enemy_type(extended_type: ExtendedEnemyType) -> EnemyType:
     Returns:
         The corresponding core EnemyType.
     """
-    mapping = {
-        ExtendedEnemyType.GOBLIN: EnemyType.GOBLIN,
-        ExtendedEnemyType.ORC: EnemyType.ORC,
-        ExtendedEnemyType.SKELETON: EnemyType.SKELETON,
-        ExtendedEnemyType.DRAGON: EnemyType.DRAGON,
-        ExtendedEnemyType.WRAITH: EnemyType.SKELETON,
-        ExtendedEnemyType.ROBOT: EnemyType.ORC,
-        ExtendedEnemyType.TURRET: EnemyType.GOBLIN,
-        ExtendedEnemyType.FIRE_ELEMENTAL: EnemyType.DRAGON,
-        ExtendedEnemyType.LAVA_GOLEM: EnemyType.ORC,
-        ExtendedEnemyType.FROST_WRAITH: EnemyType.SKELETON,
-        ExtendedEnemyType.ICE_GOLEM: EnemyType.ORC,
-        ExtendedEnemyType.VOID_SPAWN: EnemyType.SKELETON,
-        ExtendedEnemyType.MIND_FLAYER: EnemyType.DRAGON,
-    }
-    return mapping.get(extended_type, EnemyType.GOBLIN)
+    return _CORE_ENEMY_TYPES.get(extended_type, EnemyType.GOBLIN)
 
 
 def _map_to_core_trap_type(extended_type: ExtendedTrapType) -> TrapType:
@@ -327,18 +341,42 @@ def _map_to_core_trap_type(extended_type: ExtendedTrapType) -> TrapType:
     Returns:
         The corresponding core TrapType.
     """
-    mapping = {
-        ExtendedTrapType.SPIKE: TrapType.SPIKE,
-        ExtendedTrapType.POISON: TrapType.POISON,
-        ExtendedTrapType.ARROW: TrapType.ARROW,
-        ExtendedTrapType.FIRE: TrapType.FIRE,
-        ExtendedTrapType.CURSE: TrapType.POISON,
-        ExtendedTrapType.LASER: TrapType.ARROW,
-        ExtendedTrapType.EXPLOSION: TrapType.FIRE,
-        ExtendedTrapType.LAVA: TrapType.FIRE,
-        ExtendedTrapType.ICE: TrapType.SPIKE,
-        ExtendedTrapType.FREEZE: TrapType.POISON,
-        ExtendedTrapType.MADNESS: TrapType.POISON,
-        ExtendedTrapType.VOID: TrapType.FIRE,
-    }
-    return mapping.get(extended_type, TrapType.SPIKE)
+    return _CORE_TRAP_TYPES.get(extended_type, TrapType.SPIKE)
+
+
+def _build_theme_tables() -> tuple:
+    """Precompute each theme's spawnable enemies and traps.
+    
+    Stat modifiers, display names and core type mappings are applied once
+    here, so spawning is a random choice plus a constructor call.
+    
+    Returns:
+        Tuple of (enemy table, trap table). Enemy entries are
+        (core_type, name, health, attack, defense) and trap entries are
+        (core_type, low, high) damage bounds including the -3..+5 jitter,
+        in the theme's listed order. Only rows with low < 1 need clamping.
+    """
+    enemy_table: Dict[DungeonTheme, List[tuple]] = {}
+    trap_table: Dict[DungeonTheme, List[tuple]] = {}
+    
+    for theme, config in THEME_CONFIGS.items():
+        modifier = config.enemy_stats_modifier
+        enemy_table[theme] = [
+            (
+                _map_to_core_enemy_type(enemy_type),
+                _ENEMY_DISPLAY_NAMES[enemy_type],
+                int(ENEMY_STATS[enemy_type]["health"] * modifier),
+                int(ENEMY_STATS[enemy_type]["attack"] * modifier),
+                int(ENEMY_STATS[enemy_type]["defense"] * modifier),
+            )
+            for enemy_type in config.enemy_types
+        ]
+        trap_table[theme] = []
+        for trap_type in config.trap_types:
+            damage = int(TRAP_BASE_DAMAGE[trap_type] * config.trap_damage_modifier)
+            trap_table[theme].append((_map_to_core_trap_type(trap_type), damage - 3, damage + 5))
+    
+    return enemy_table, trap_table
+
+
+_THEME_ENEMY_TABLE, _THEME_TRAP_TABLE = _build_theme_tables()
@@ -2,9 +2,12 @@
 Dynamic Dungeon Events for DungeonCrawlerAI.
 Implements random and triggered events that affect gameplay.
 """
-from enum import Enum
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from enum import IntEnum
+from dataclasses import dataclass
+from typing import List, Optional, Dict, Any, Deque, NamedTuple, Set, Tuple
+from bisect import bisect_right
+from collections import Counter, deque
+from itertools import accumulate
 import random
 
 from models import Hero, Room, Trap, TrapType, Enemy, EnemyType
@@ -12,33 +15,33 @@ from dungeon import Dungeon
 from events import EventBus, Event, EventType
 
 
-class DungeonEventType(Enum):
-    """Types of dynamic dungeon events."""
+class DungeonEventType(IntEnum):
+    """Types of dynamic dungeon events, numbered densely to index per-type tables."""
     
     # Natural events
-    COLLAPSE = "collapse"
-    FLOOD = "flood"
-    EARTHQUAKE = "earthquake"
-    GAS_LEAK = "gas_leak"
+    COLLAPSE = 0
+    FLOOD = 1
+    EARTHQUAKE = 2
+    GAS_LEAK = 3
     
     # Supernatural events
-    GHOST_SPAWN = "ghost_spawn"
-    BLESSING = "blessing"
-    CURSE_WEAKENED = "curse_weakened"
-    SOUL_ECHO = "soul_echo"
+    GHOST_SPAWN = 4
+    BLESSING = 5
+    CURSE_WEAKENED = 6
+    SOUL_ECHO = 7
     
     # Curse events
-    CURSE_STRENGTHENED = "curse_strengthened"
-    ENERGY_SURGE = "energy_surge"
-    VOID_RIFT = "void_rift"
+    CURSE_STRENGTHENED = 8
+    ENERGY_SURGE = 9
+    VOID_RIFT = 10
     
     # Hero events
-    HERO_BLESSED = "hero_blessed"
-    SECOND_WIND = "second_wind"
-    DIVINE_INTERVENTION = "divine_intervention"
+    HERO_BLESSED = 11
+    SECOND_WIND = 12
+    DIVINE_INTERVENTION = 13
 
 
-@dataclass
+@dataclass(slots=True)
 class DungeonEvent:
     """Represents a dynamic dungeon event."""
     
@@ -49,12 +52,81 @@ class DungeonEvent:
     probability: float
     affects_hero: bool
     affects_curse: bool
-    effect_data: Dict[str, Any] = field(default_factory=dict)
+    effect_data: Optional[NamedTuple] = None
     
     def __repr__(self):
         return f"DungeonEvent({self.name}, duration={self.duration})"
 
 
+# Fixed effect parameters for each event type.
+class CollapseEffect(NamedTuple):
+    damage: int = 25
+    blocks_room: bool = True
+
+
+class FloodEffect(NamedTuple):
+    movement_penalty: float = 0.5
+    damage_per_turn: int = 5
+
+
+class EarthquakeEffect(NamedTuple):
+    triggers_all_traps: bool = True
+
+
+class GasLeakEffect(NamedTuple):
+    poison_damage: int = 8
+    vision_reduced: bool = True
+
+
+class GhostSpawnEffect(NamedTuple):
+    spawn_ghosts: int = 2
+    ghost_damage: int = 10
+
+
+class BlessingEffect(NamedTuple):
+    temp_hp: int = 30
+    curse_cost_modifier: float = 1.5
+
+
+class CurseWeakenedEffect(NamedTuple):
+    curse_power_modifier: float = 0.5
+    energy_regen_modifier: float = 0.5
+
+
+class SoulEchoEffect(NamedTuple):
+    reveals_traps: bool = True
+    attack_bonus: int = 5
+
+
+class CurseStrengthenedEffect(NamedTuple):
+    curse_cost_modifier: float = 0.7
+    energy_regen_bonus: int = 15
+
+
+class EnergySurgeEffect(NamedTuple):
+    energy_restore: int = 50
+
+
+class VoidRiftEffect(NamedTuple):
+    hero_damage_per_turn: int = 5
+    curse_cost_modifier: float = 0.5
+
+
+class HeroBlessedEffect(NamedTuple):
+    attack_bonus: int = 10
+    defense_bonus: int = 5
+
+
+class SecondWindEffect(NamedTuple):
+    heal_percent: float = 0.25
+    attack_bonus: int = 5
+
+
+class DivineInterventionEffect(NamedTuple):
+    full_heal: bool = True
+    curse_stunned: bool = True
+
+
 # Event definitions with their properties
 EVENT_DEFINITIONS: Dict[DungeonEventType, Dict[str, Any]] = {
     # Natural events
@@ -65,7 +137,7 @@ EVENT_DEFINITIONS: Dict[DungeonEventType, Dict[str, Any]] = {
         "probability": 0.03,
         "affects_hero": True,
         "affects_curse": False,
-        "effect_data": {"damage": 25, "blocks_room": True}
+        "effect_data": CollapseEffect(damage=25, blocks_room=True)
     },
     DungeonEventType.FLOOD: {
         "name": "Underground Flood",
@@ -74,7 +146,7 @@ EVENT_DEFINITIONS: Dict[DungeonEventType, Dict[str, Any]] = {
         "probability": 0.04,
         "affects_hero": True,
         "affects_curse": False,
-        "effect_data": {"movement_penalty": 0.5, "damage_per_turn": 5}
+        "effect_data": FloodEffect(movement_penalty=0.5, damage_per_turn=5)
     },
     DungeonEventType.EARTHQUAKE: {
         "name": "Earthquake",
@@ -83,7 +155,7 @@ EVENT_DEFINITIONS: Dict[DungeonEventType, Dict[str, Any]] = {
         "probability": 0.02,
         "affects_hero": True,
         "affects_curse": False,
-        "effect_data": {"triggers_all_traps": True}
+        "effect_data": EarthquakeEffect(triggers_all_traps=True)
     },
     DungeonEventType.GAS_LEAK: {
         "name": "Toxic Gas Leak",
@@ -92,7 +164,7 @@ EVENT_DEFINITIONS: Dict[DungeonEventType, Dict[str, Any]] = {
         "probability": 0.05,
         "affects_hero": True,
         "affects_curse": False,
-        "effect_data": {"poison_damage": 8, "vision_reduced": True}
+        "effect_data": GasLeakEffect(poison_damage=8, vision_reduced=True)
     },
     
     # Supernatural events
@@ -103,7 +175,7 @@ EVENT_DEFINITIONS: Dict[DungeonEventType, Dict[str, Any]] = {
         "probability": 0.04,
         "affects_hero": True,
         "affects_curse": False,
-        "effect_data": {"spawn_ghosts": 2, "ghost_damage": 10}
+        "effect_data": GhostSpawnEffect(spawn_ghosts=2, ghost_damage=10)
     },
     DungeonEventType.BLESSING: {
         "name": "Divine Blessing",
@@ -112,7 +184,7 @@ EVENT_DEFINITIONS: Dict[DungeonEventType, Dict[str, Any]] = {
         "probability": 0.03,
         "affects_hero": True,
         "affects_curse": True,
-        "effect_data": {"temp_hp": 30, "curse_cost_modifier": 1.5}
+        "effect_data": BlessingEffect(temp_hp=30, curse_cost_modifier=1.5)
     },
     DungeonEventType.CURSE_WEAKENED: {
         "name": "Curse Weakened",
@@ -121,7 +193,7 @@ EVENT_DEFINITIONS: Dict[DungeonEventType, Dict[str, Any]] = {
         "probability": 0.03,
         "affects_hero": False,
         "affects_curse": True,
-        "effect_data": {"curse_power_modifier": 0.5, "energy_regen_modifier": 0.5}
+        "effect_data": CurseWeakenedEffect(curse_power_modifier=0.5, energy_regen_modifier=0.5)
     },
     DungeonEventType.SOUL_ECHO: {
         "name": "Soul Echo",
@@ -130,7 +202,7 @@ EVENT_DEFINITIONS: Dict[DungeonEventType, Dict[str, Any]] = {
         "probability": 0.05,
         "affects_hero": True,
         "affects_curse": False,
-        "effect_data": {"reveals_traps": True, "attack_bonus": 5}
+        "effect_data": SoulEchoEffect(reveals_traps=True, attack_bonus=5)
     },
     
     # Curse events
@@ -141,7 +213,7 @@ EVENT_DEFINITIONS: Dict[DungeonEventType, Dict[str, Any]] = {
         "probability": 0.04,
         "affects_hero": False,
         "affects_curse": True,
-        "effect_data": {"curse_cost_modifier": 0.7, "energy_regen_bonus": 15}
+        "effect_data": CurseStrengthenedEffect(curse_cost_modifier=0.7, energy_regen_bonus=15)
     },
     DungeonEventType.ENERGY_SURGE: {
         "name": "Energy Surge",
@@ -150,7 +222,7 @@ EVENT_DEFINITIONS: Dict[DungeonEventType, Dict[str, Any]] = {
         "probability": 0.05,
         "affects_hero": False,
         "affects_curse": True,
-        "effect_data": {"energy_restore": 50}
+        "effect_data": EnergySurgeEffect(energy_restore=50)
     },
     DungeonEventType.VOID_RIFT: {
         "name": "Void Rift",
@@ -159,7 +231,7 @@ EVENT_DEFINITIONS: Dict[DungeonEventType, Dict[str, Any]] = {
         "probability": 0.02,
         "affects_hero": True,
         "affects_curse": True,
-        "effect_data": {"hero_damage_per_turn": 5, "curse_cost_modifier": 0.5}
+        "effect_data": VoidRiftEffect(hero_damage_per_turn=5, curse_cost_modifier=0.5)
     },
     
     # Hero events
@@ -170,7 +242,7 @@ EVENT_DEFINITIONS: Dict[DungeonEventType, Dict[str, Any]] = {
         "probability": 0.03,
         "affects_hero": True,
         "affects_curse": False,
-        "effect_data": {"attack_bonus": 10, "defense_bonus": 5}
+        "effect_data": HeroBlessedEffect(attack_bonus=10, defense_bonus=5)
     },
     DungeonEventType.SECOND_WIND: {
         "name": "Second Wind",
@@ -179,7 +251,7 @@ EVENT_DEFINITIONS: Dict[DungeonEventType, Dict[str, Any]] = {
         "probability": 0.04,
         "affects_hero": True,
         "affects_curse": False,
-        "effect_data": {"heal_percent": 0.25, "attack_bonus": 5}
+        "effect_data": SecondWindEffect(heal_percent=0.25, attack_bonus=5)
     },
     DungeonEventType.DIVINE_INTERVENTION: {
         "name": "Divine Intervention",
@@ -188,26 +260,121 @@ EVENT_DEFINITIONS: Dict[DungeonEventType, Dict[str, Any]] = {
         "probability": 0.01,
         "affects_hero": True,
         "affects_curse": True,
-        "effect_data": {"full_heal": True, "curse_stunned": True}
+        "effect_data": DivineInterventionEffect(full_heal=True, curse_stunned=True)
     }
 }
 
 
+# Event properties flattened into index-aligned tuples, built once at import.
+_EVENT_TYPES: Tuple[DungeonEventType, ...] = tuple(EVENT_DEFINITIONS)
+_EVENT_PROBABILITIES: Tuple[float, ...] = tuple(
+    d["probability"] for d in EVENT_DEFINITIONS.values()
+)
+
+# Fixed DungeonEvent constructor arguments per event type.
+_EVENT_TEMPLATE_ARGS: Dict[DungeonEventType, Tuple[Any, ...]] = {
+    event_type: (
+        event_type,
+        d["name"],
+        d["description"],
+        d["duration"],
+        d["probability"],
+        d["affects_hero"],
+        d["affects_curse"],
+    )
+    for event_type, d in EVENT_DEFINITIONS.items()
+}
+
+
+def _modifier_vector(data: NamedTuple) -> Tuple[int, int, int, float, float, float, bool]:
+    """Pack an event's stat modifiers into a fixed-order tuple.
+
+    Order: attack bonus, defense bonus, hero damage per turn, curse cost
+    modifier, energy regen modifier, movement penalty, curse stunned.
+    """
+    return (
+        getattr(data, "attack_bonus", 0),
+        getattr(data, "defense_bonus", 0),
+        getattr(data, "hero_damage_per_turn", 0),
+        getattr(data, "curse_cost_modifier", 1.0),
+        getattr(data, "energy_regen_modifier", 1.0),
+        getattr(data, "movement_penalty", 1.0),
+        getattr(data, "curse_stunned", False),
+    )
+
+
+# Modifier vectors for the event types that affect stats; others contribute nothing.
+_NEUTRAL_MODIFIERS = (0, 0, 0, 1.0, 1.0, 1.0, False)
+_EVENT_MODIFIERS: Dict[DungeonEventType, Tuple[int, int, int, float, float, float, bool]] = {
+    event_type: vector
+    for event_type, vector in (
+        (event_type, _modifier_vector(d["effect_data"]))
+        for event_type, d in EVENT_DEFINITIONS.items()
+    )
+    if vector != _NEUTRAL_MODIFIERS
+}
+
+# Cumulative event probabilities so a single random() draw picks at most one event,
+# each firing with exactly its listed probability.
+_EVENT_CUM_PROBABILITY: List[float] = list(accumulate(_EVENT_PROBABILITIES))
+_EVENT_TOTAL_PROBABILITY: float = _EVENT_CUM_PROBABILITY[-1]
+
+# Events likely enough to be forecast, paired with their forecast line.
+_FORECAST_THRESHOLD = 0.04
+_FORECAST_EVENTS: Tuple[Tuple[DungeonEventType, str], ...] = tuple(
+    (event_type, f"{EVENT_DEFINITIONS[event_type]['name']} ({probability*100:.0f}% chance)")
+    for event_type, probability in zip(_EVENT_TYPES, _EVENT_PROBABILITIES)
+    if probability >= _FORECAST_THRESHOLD
+)
+
+# Event groups whose stacking shows up in the forecast.
+_CURSE_EVENT_TYPES = frozenset({
+    DungeonEventType.CURSE_STRENGTHENED,
+    DungeonEventType.ENERGY_SURGE,
+    DungeonEventType.VOID_RIFT,
+})
+_HERO_EVENT_TYPES = frozenset({
+    DungeonEventType.HERO_BLESSED,
+    DungeonEventType.SECOND_WIND,
+    DungeonEventType.DIVINE_INTERVENTION,
+})
+
+
 class EventManager:
     """Manages dynamic dungeon events."""
     
-    def __init__(self, event_bus: Optional[EventBus] = None):
+    def __init__(
+        self,
+        event_bus: Optional[EventBus] = None,
+        max_history: int = 256,
+        seed: Optional[int] = None,
+        event_cooldown: int = 0
+    ):
         """
         Initialize the event manager.
         
         Args:
             event_bus: Optional event bus for publishing events.
+            max_history: Maximum number of past events to keep in event_history.
+            seed: Optional seed for a private generator so event rolls are
+                reproducible; the shared random module state is used when omitted.
+            event_cooldown: Number of quiet turns after an event during which
+                no new random event is rolled.
         """
+        if seed is None:
+            self._random, self._choice = random.random, random.choice
+        else:
+            rng = random.Random(seed)
+            self._random, self._choice = rng.random, rng.choice
         self.active_events: List[DungeonEvent] = []
-        self.event_history: List[DungeonEvent] = []
+        self.event_history: Deque[DungeonEvent] = deque(maxlen=max_history)
         self.turn_count: int = 0
+        self.event_cooldown = event_cooldown
+        self._next_roll_turn: int = 0
         self.event_bus = event_bus
-        self._blocked_rooms: List[int] = []
+        self._blocked_rooms: Set[int] = set()
+        self._active_type_counts: Counter = Counter()
+        self._curse_capabilities: Dict[type, Tuple[bool, bool]] = {}
     
     def tick(self) -> Optional[DungeonEvent]:
         """
@@ -219,9 +386,12 @@ class EventManager:
         self.turn_count += 1
         self.update_active_events()
         
-        for event_type, definition in EVENT_DEFINITIONS.items():
-            if random.random() < definition["probability"]:
-                return self.trigger_event(event_type)
+        if self.turn_count < self._next_roll_turn:
+            return None
+        
+        roll = self._random()
+        if roll < _EVENT_TOTAL_PROBABILITY:
+            return self.trigger_event(_EVENT_TYPES[bisect_right(_EVENT_CUM_PROBABILITY, roll)])
         
         return None
     
@@ -235,21 +405,15 @@ class EventManager:
         Returns:
             The triggered DungeonEvent.
         """
-        definition = EVENT_DEFINITIONS[event_type]
-        
         event = DungeonEvent(
-            event_type=event_type,
-            name=definition["name"],
-            description=definition["description"],
-            duration=definition["duration"],
-            probability=definition["probability"],
-            affects_hero=definition["affects_hero"],
-            affects_curse=definition["affects_curse"],
-            effect_data=definition["effect_data"].copy()
+            *_EVENT_TEMPLATE_ARGS[event_type],
+            EVENT_DEFINITIONS[event_type]["effect_data"]
         )
         
         self.active_events.append(event)
         self.event_history.append(event)
+        self._active_type_counts[event_type] += 1
+        self._next_roll_turn = self.turn_count + self.event_cooldown + 1
         
         if self.event_bus:
             self.event_bus.publish(Event(
@@ -279,104 +443,246 @@ class EventManager:
             A dict describing the effects applied.
         """
         effects_applied = {"event": event.name, "effects": []}
-        data = event.effect_data
-        
-        if event.event_type == DungeonEventType.COLLAPSE:
-            if hero.current_room_id is not None:
-                connected = dungeon.get_connected_rooms(hero.current_room_id)
-                if connected:
-                    blocked_room = random.choice(connected)
-                    self._blocked_rooms.append(blocked_room)
-                    effects_applied["effects"].append(f"Room {blocked_room} blocked")
-                    
-                    room = dungeon.get_room(blocked_room)
-                    if room and hero.current_room_id == blocked_room:
-                        damage = hero.take_damage(data.get("damage", 25))
-                        effects_applied["effects"].append(f"Hero took {damage} collapse damage")
-        
-        elif event.event_type == DungeonEventType.FLOOD:
-            damage = data.get("damage_per_turn", 5)
-            hero.take_damage(damage)
-            effects_applied["effects"].append(f"Hero took {damage} flood damage")
-        
-        elif event.event_type == DungeonEventType.EARTHQUAKE:
-            if data.get("triggers_all_traps"):
-                total_damage = 0
-                for room in dungeon.rooms.values():
-                    for trap in room.traps:
-                        if not trap.triggered and room.room_id == hero.current_room_id:
-                            damage = trap.trigger()
-                            total_damage += damage
-                if total_damage > 0:
-                    hero.take_damage(total_damage)
-                    effects_applied["effects"].append(f"Earthquake triggered traps for {total_damage} damage")
-        
-        elif event.event_type == DungeonEventType.GAS_LEAK:
-            poison_damage = data.get("poison_damage", 8)
-            hero.take_damage(poison_damage)
-            effects_applied["effects"].append(f"Hero took {poison_damage} poison damage")
-        
-        elif event.event_type == DungeonEventType.GHOST_SPAWN:
-            if hero.current_room_id is not None:
-                room = dungeon.get_room(hero.current_room_id)
-                if room:
-                    num_ghosts = data.get("spawn_ghosts", 2)
-                    for _ in range(num_ghosts):
-                        ghost = Enemy(EnemyType.SKELETON, "Ghost", 20, data.get("ghost_damage", 10), 0)
-                        room.add_enemy(ghost)
-                    effects_applied["effects"].append(f"Spawned {num_ghosts} ghosts")
-        
-        elif event.event_type == DungeonEventType.BLESSING:
-            temp_hp = data.get("temp_hp", 30)
-            hero.max_health += temp_hp
-            hero.health += temp_hp
-            effects_applied["effects"].append(f"Hero gained {temp_hp} temporary HP")
-        
-        elif event.event_type == DungeonEventType.CURSE_WEAKENED:
-            if hasattr(curse, 'curse_energy'):
-                curse.curse_energy = int(curse.curse_energy * data.get("curse_power_modifier", 0.5))
-                effects_applied["effects"].append("Curse power weakened")
-        
-        elif event.event_type == DungeonEventType.SOUL_ECHO:
-            hero.attack += data.get("attack_bonus", 5)
-            effects_applied["effects"].append(f"Hero attack increased by {data.get('attack_bonus', 5)}")
-        
-        elif event.event_type == DungeonEventType.CURSE_STRENGTHENED:
-            if hasattr(curse, 'curse_energy') and hasattr(curse, 'max_curse_energy'):
-                bonus = data.get("energy_regen_bonus", 15)
-                curse.curse_energy = min(curse.max_curse_energy, curse.curse_energy + bonus)
-                effects_applied["effects"].append(f"Curse gained {bonus} energy")
-        
-        elif event.event_type == DungeonEventType.ENERGY_SURGE:
-            if hasattr(curse, 'curse_energy') and hasattr(curse, 'max_curse_energy'):
-                restore = data.get("energy_restore", 50)
-                curse.curse_energy = min(curse.max_curse_energy, curse.curse_energy + restore)
-                effects_applied["effects"].append(f"Curse restored {restore} energy")
-        
-        elif event.event_type == DungeonEventType.VOID_RIFT:
-            damage = data.get("hero_damage_per_turn", 5)
-            hero.take_damage(damage)
-            effects_applied["effects"].append(f"Void rift dealt {damage} damage to hero")
-        
-        elif event.event_type == DungeonEventType.HERO_BLESSED:
-            hero.attack += data.get("attack_bonus", 10)
-            hero.defense += data.get("defense_bonus", 5)
-            effects_applied["effects"].append("Hero blessed with bonus stats")
-        
-        elif event.event_type == DungeonEventType.SECOND_WIND:
-            heal_percent = data.get("heal_percent", 0.25)
-            heal_amount = int(hero.max_health * heal_percent)
-            hero.heal(heal_amount)
-            hero.attack += data.get("attack_bonus", 5)
-            effects_applied["effects"].append(f"Hero healed {heal_amount} HP and gained attack bonus")
-        
-        elif event.event_type == DungeonEventType.DIVINE_INTERVENTION:
-            if data.get("full_heal"):
-                hero.health = hero.max_health
-                effects_applied["effects"].append("Hero fully healed by divine intervention")
-        
+        self._EFFECT_HANDLERS[event.event_type](
+            self, event.effect_data, hero, curse, dungeon, effects_applied["effects"]
+        )
         return effects_applied
     
+    def _curse_caps(self, curse: Any) -> Tuple[bool, bool]:
+        """
+        Report whether a curse has curse_energy and max_curse_energy.
+        
+        The answer is cached per curse class, so each class is probed only once.
+        """
+        caps = self._curse_capabilities.get(type(curse))
+        if caps is None:
+            caps = (hasattr(curse, 'curse_energy'), hasattr(curse, 'max_curse_energy'))
+            self._curse_capabilities[type(curse)] = caps
+        return caps
+    
+    def _apply_collapse(
+        self,
+        data: CollapseEffect,
+        hero: Hero,
+        curse: Any,
+        dungeon: Dungeon,
+        effects: List[str]
+    ) -> None:
+        """Block a room next to the hero."""
+        if hero.current_room_id is not None:
+            connected = dungeon.get_connected_rooms(hero.current_room_id)
+            if connected:
+                blocked_room = self._choice(connected)
+                self._blocked_rooms.add(blocked_room)
+                effects.append(f"Room {blocked_room} blocked")
+                
+                room = dungeon.get_room(blocked_room)
+                if room and hero.current_room_id == blocked_room:
+                    damage = hero.take_damage(data.damage)
+                    effects.append(f"Hero took {damage} collapse damage")
+    
+    def _apply_flood(
+        self,
+        data: FloodEffect,
+        hero: Hero,
+        curse: Any,
+        dungeon: Dungeon,
+        effects: List[str]
+    ) -> None:
+        """Deal flood damage to the hero."""
+        damage = data.damage_per_turn
+        hero.take_damage(damage)
+        effects.append(f"Hero took {damage} flood damage")
+    
+    def _apply_earthquake(
+        self,
+        data: EarthquakeEffect,
+        hero: Hero,
+        curse: Any,
+        dungeon: Dungeon,
+        effects: List[str]
+    ) -> None:
+        """Spring every trap in the hero's room."""
+        if data.triggers_all_traps:
+            room = dungeon.get_room(hero.current_room_id)
+            total_damage = sum(trap.trigger() for trap in room.traps) if room else 0
+            if total_damage > 0:
+                hero.take_damage(total_damage)
+                effects.append(f"Earthquake triggered traps for {total_damage} damage")
+    
+    def _apply_gas_leak(
+        self,
+        data: GasLeakEffect,
+        hero: Hero,
+        curse: Any,
+        dungeon: Dungeon,
+        effects: List[str]
+    ) -> None:
+        """Deal poison damage to the hero."""
+        poison_damage = data.poison_damage
+        hero.take_damage(poison_damage)
+        effects.append(f"Hero took {poison_damage} poison damage")
+    
+    def _apply_ghost_spawn(
+        self,
+        data: GhostSpawnEffect,
+        hero: Hero,
+        curse: Any,
+        dungeon: Dungeon,
+        effects: List[str]
+    ) -> None:
+        """Spawn ghosts in the hero's room."""
+        if hero.current_room_id is not None:
+            room = dungeon.get_room(hero.current_room_id)
+            if room:
+                num_ghosts = data.spawn_ghosts
+                for _ in range(num_ghosts):
+                    ghost = Enemy(EnemyType.SKELETON, "Ghost", 20, data.ghost_damage, 0)
+                    room.add_enemy(ghost)
+                effects.append(f"Spawned {num_ghosts} ghosts")
+    
+    def _apply_blessing(
+        self,
+        data: BlessingEffect,
+        hero: Hero,
+        curse: Any,
+        dungeon: Dungeon,
+        effects: List[str]
+    ) -> None:
+        """Grant the hero temporary HP."""
+        temp_hp = data.temp_hp
+        hero.max_health += temp_hp
+        hero.health += temp_hp
+        effects.append(f"Hero gained {temp_hp} temporary HP")
+    
+    def _apply_curse_weakened(
+        self,
+        data: CurseWeakenedEffect,
+        hero: Hero,
+        curse: Any,
+        dungeon: Dungeon,
+        effects: List[str]
+    ) -> None:
+        """Cut the curse's energy."""
+        has_energy, _ = self._curse_caps(curse)
+        if has_energy:
+            curse.curse_energy = int(curse.curse_energy * data.curse_power_modifier)
+            effects.append("Curse power weakened")
+    
+    def _apply_soul_echo(
+        self,
+        data: SoulEchoEffect,
+        hero: Hero,
+        curse: Any,
+        dungeon: Dungeon,
+        effects: List[str]
+    ) -> None:
+        """Raise the hero's attack."""
+        hero.attack += data.attack_bonus
+        effects.append(f"Hero attack increased by {data.attack_bonus}")
+    
+    def _apply_curse_strengthened(
+        self,
+        data: CurseStrengthenedEffect,
+        hero: Hero,
+        curse: Any,
+        dungeon: Dungeon,
+        effects: List[str]
+    ) -> None:
+        """Give the curse bonus energy."""
+        has_energy, has_max_energy = self._curse_caps(curse)
+        if has_energy and has_max_energy:
+            bonus = data.energy_regen_bonus
+            curse.curse_energy = min(curse.max_curse_energy, curse.curse_energy + bonus)
+            effects.append(f"Curse gained {bonus} energy")
+    
+    def _apply_energy_surge(
+        self,
+        data: EnergySurgeEffect,
+        hero: Hero,
+        curse: Any,
+        dungeon: Dungeon,
+        effects: List[str]
+    ) -> None:
+        """Restore curse energy."""
+        has_energy, has_max_energy = self._curse_caps(curse)
+        if has_energy and has_max_energy:
+            restore = data.energy_restore
+            curse.curse_energy = min(curse.max_curse_energy, curse.curse_energy + restore)
+            effects.append(f"Curse restored {restore} energy")
+    
+    def _apply_void_rift(
+        self,
+        data: VoidRiftEffect,
+        hero: Hero,
+        curse: Any,
+        dungeon: Dungeon,
+        effects: List[str]
+    ) -> None:
+        """Deal void damage to the hero."""
+        damage = data.hero_damage_per_turn
+        hero.take_damage(damage)
+        effects.append(f"Void rift dealt {damage} damage to hero")
+    
+    def _apply_hero_blessed(
+        self,
+        data: HeroBlessedEffect,
+        hero: Hero,
+        curse: Any,
+        dungeon: Dungeon,
+        effects: List[str]
+    ) -> None:
+        """Raise the hero's attack and defense."""
+        hero.attack += data.attack_bonus
+        hero.defense += data.defense_bonus
+        effects.append("Hero blessed with bonus stats")
+    
+    def _apply_second_wind(
+        self,
+        data: SecondWindEffect,
+        hero: Hero,
+        curse: Any,
+        dungeon: Dungeon,
+        effects: List[str]
+    ) -> None:
+        """Heal the hero and raise their attack."""
+        heal_percent = data.heal_percent
+        heal_amount = int(hero.max_health * heal_percent)
+        hero.heal(heal_amount)
+        hero.attack += data.attack_bonus
+        effects.append(f"Hero healed {heal_amount} HP and gained attack bonus")
+    
+    def _apply_divine_intervention(
+        self,
+        data: DivineInterventionEffect,
+        hero: Hero,
+        curse: Any,
+        dungeon: Dungeon,
+        effects: List[str]
+    ) -> None:
+        """Fully heal the hero."""
+        if data.full_heal:
+            hero.health = hero.max_health
+            effects.append("Hero fully healed by divine intervention")
+    
+    # Indexed by DungeonEventType, in enum order.
+    _EFFECT_HANDLERS = (
+        _apply_collapse,
+        _apply_flood,
+        _apply_earthquake,
+        _apply_gas_leak,
+        _apply_ghost_spawn,
+        _apply_blessing,
+        _apply_curse_weakened,
+        _apply_soul_echo,
+        _apply_curse_strengthened,
+        _apply_energy_surge,
+        _apply_void_rift,
+        _apply_hero_blessed,
+        _apply_second_wind,
+        _apply_divine_intervention,
+    )
+    
     def update_active_events(self) -> List[DungeonEvent]:
         """
         Decrement durations and remove expired events.
@@ -385,18 +691,17 @@ class EventManager:
             List of expired events that were removed.
         """
         expired = []
-        still_active = []
         
         for event in self.active_events:
             event.duration -= 1
             if event.duration <= 0:
                 expired.append(event)
+                self._active_type_counts[event.event_type] -= 1
                 if event.event_type == DungeonEventType.COLLAPSE:
                     self._blocked_rooms.clear()
-            else:
-                still_active.append(event)
         
-        self.active_events = still_active
+        if expired:
+            self.active_events = [e for e in self.active_events if e.duration > 0]
         return expired
     
     def get_active_modifiers(self) -> Dict[str, Any]:
@@ -406,36 +711,35 @@ class EventManager:
         Returns:
             Dict containing all active stat modifiers.
         """
-        modifiers = {
-            "hero_attack_bonus": 0,
-            "hero_defense_bonus": 0,
-            "hero_damage_per_turn": 0,
-            "curse_cost_modifier": 1.0,
-            "curse_energy_regen_modifier": 1.0,
-            "blocked_rooms": self._blocked_rooms.copy(),
-            "movement_penalty": 1.0,
-            "curse_stunned": False
-        }
+        attack = defense = damage = 0
+        cost = regen = movement = 1.0
+        stunned = False
         
         for event in self.active_events:
-            data = event.effect_data
+            vector = _EVENT_MODIFIERS.get(event.event_type)
+            if vector is None:
+                continue
             
-            if "attack_bonus" in data:
-                modifiers["hero_attack_bonus"] += data["attack_bonus"]
-            if "defense_bonus" in data:
-                modifiers["hero_defense_bonus"] += data["defense_bonus"]
-            if "hero_damage_per_turn" in data:
-                modifiers["hero_damage_per_turn"] += data["hero_damage_per_turn"]
-            if "curse_cost_modifier" in data:
-                modifiers["curse_cost_modifier"] *= data["curse_cost_modifier"]
-            if "energy_regen_modifier" in data:
-                modifiers["curse_energy_regen_modifier"] *= data["energy_regen_modifier"]
-            if "movement_penalty" in data:
-                modifiers["movement_penalty"] *= data["movement_penalty"]
-            if data.get("curse_stunned"):
-                modifiers["curse_stunned"] = True
-        
-        return modifiers
+            (event_attack, event_defense, event_damage,
+             event_cost, event_regen, event_movement, event_stunned) = vector
+            attack += event_attack
+            defense += event_defense
+            damage += event_damage
+            cost *= event_cost
+            regen *= event_regen
+            movement *= event_movement
+            stunned = stunned or event_stunned
+        
+        return {
+            "hero_attack_bonus": attack,
+            "hero_defense_bonus": defense,
+            "hero_damage_per_turn": damage,
+            "curse_cost_modifier": cost,
+            "curse_energy_regen_modifier": regen,
+            "blocked_rooms": list(self._blocked_rooms),
+            "movement_penalty": movement,
+            "curse_stunned": stunned
+        }
     
     def get_event_forecast(self) -> List[str]:
         """
@@ -444,42 +748,20 @@ class EventManager:
         Returns:
             List of strings describing likely upcoming events.
         """
-        forecasts = []
-        
-        high_probability_events = [
-            (etype, defn) for etype, defn in EVENT_DEFINITIONS.items()
-            if defn["probability"] >= 0.04
+        active_counts = self._active_type_counts
+        forecasts = [
+            line for event_type, line in _FORECAST_EVENTS
+            if not active_counts[event_type]
         ]
         
-        for event_type, definition in high_probability_events:
-            already_active = any(e.event_type == event_type for e in self.active_events)
-            if not already_active:
-                forecasts.append(
-                    f"{definition['name']} ({definition['probability']*100:.0f}% chance)"
-                )
-        
         if self.turn_count > 10 and self.turn_count % 5 == 0:
             forecasts.append("Environmental instability increasing...")
         
-        curse_events_active = sum(
-            1 for e in self.active_events 
-            if e.event_type in [
-                DungeonEventType.CURSE_STRENGTHENED,
-                DungeonEventType.ENERGY_SURGE,
-                DungeonEventType.VOID_RIFT
-            ]
-        )
+        curse_events_active = sum(active_counts[t] for t in _CURSE_EVENT_TYPES)
         if curse_events_active >= 2:
             forecasts.append("Divine intervention likely due to curse activity")
         
-        hero_events_active = sum(
-            1 for e in self.active_events
-            if e.event_type in [
-                DungeonEventType.HERO_BLESSED,
-                DungeonEventType.SECOND_WIND,
-                DungeonEventType.DIVINE_INTERVENTION
-            ]
-        )
+        hero_events_active = sum(active_counts[t] for t in _HERO_EVENT_TYPES)
         if hero_events_active >= 2:
             forecasts.append("Curse backlash likely due to divine presence")
         
@@ -487,7 +769,7 @@ class EventManager:
     
     def get_blocked_rooms(self) -> List[int]:
         """Get list of currently blocked room IDs."""
-        return self._blocked_rooms.copy()
+        return list(self._blocked_rooms)
     
     def is_room_blocked(self, room_id: int) -> bool:
         """Check if a specific room is blocked."""
@@ -4,7 +4,7 @@ Implements various enemy behavior patterns including aggressive, defensive,
 cowardly, tactical, and boss behaviors.
 """
 from enum import Enum
-from typing import List, Optional
+from typing import Dict, List, Optional
 from dataclasses import dataclass
 import random
 
@@ -12,9 +12,12 @@ from behavior_tree import (
     BehaviorTree, BehaviorNode, NodeStatus,
     ActionNode, ConditionNode, SequenceNode, SelectorNode
 )
-from models import Enemy, Room, Hero
+from models import Enemy, EnemyType, Room, Hero
 from events import EventBus, Event, EventType
 
+# Bound once so AI callbacks skip the module attribute lookup.
+_randint = random.randint
+
 
 class EnemyBehavior(Enum):
     """Behavior patterns for enemy AI."""
@@ -25,7 +28,7 @@ class EnemyBehavior(Enum):
     BOSS = "boss"
 
 
-@dataclass
+@dataclass(slots=True)
 class EnemyAIContext:
     """Context data passed to behavior tree nodes during enemy AI execution."""
     enemy: Enemy
@@ -33,6 +36,40 @@ class EnemyAIContext:
     hero: Hero
     event_bus: EventBus
     nearby_allies: List[Enemy]
+    ai: Optional["EnemyAI"] = None
+
+
+# Boss attack cycle as (name, damage percent of attack), plain and enraged (x1.3).
+# The cycle length is a power of two so the pattern index can be masked.
+_BOSS_PATTERNS = (
+    ("Normal Attack", 100),
+    ("Heavy Strike", 150),
+    ("Sweeping Attack", 80),
+    ("Devastating Blow", 200),
+)
+_BOSS_PATTERNS_ENRAGED = tuple((name, percent * 13 // 10) for name, percent in _BOSS_PATTERNS)
+_BOSS_PATTERN_MASK = len(_BOSS_PATTERNS) - 1
+assert len(_BOSS_PATTERNS) & _BOSS_PATTERN_MASK == 0, "boss pattern count must be a power of two"
+
+
+def _idle(ctx: EnemyAIContext) -> NodeStatus:
+    """Do nothing this turn."""
+    return NodeStatus.SUCCESS
+
+
+def _healthy_enough(ctx: EnemyAIContext) -> bool:
+    """Check whether the enemy is above half health."""
+    return ctx.enemy.health > ctx.enemy.max_health * 0.5
+
+
+def _has_allies(ctx: EnemyAIContext) -> bool:
+    """Check whether the enemy has allies nearby."""
+    return len(ctx.nearby_allies) > 0
+
+
+def _low_health(ctx: EnemyAIContext) -> bool:
+    """Check whether the enemy is below 30% health."""
+    return ctx.enemy.health < ctx.enemy.max_health * 0.3
 
 
 class EnemyAI:
@@ -40,10 +77,29 @@ class EnemyAI:
     AI controller for enemy entities using behavior trees.
     
     Each enemy can have different behavior patterns that determine
-    how they react to the hero and environment.
+    how they react to the hero and environment. Trees are built once per
+    behavior and shared by every enemy using it; node callbacks take only
+    the context and reach per-enemy state through ``ctx.ai``.
     """
     
-    def __init__(self, enemy: Enemy, behavior: EnemyBehavior, event_bus: EventBus):
+    _TREE_CACHE: Dict[EnemyBehavior, BehaviorTree] = {}
+    
+    # Builder classmethod name for each behavior pattern
+    _BUILDERS: Dict[EnemyBehavior, str] = {
+        EnemyBehavior.AGGRESSIVE: "_build_aggressive_tree",
+        EnemyBehavior.DEFENSIVE: "_build_defensive_tree",
+        EnemyBehavior.COWARDLY: "_build_cowardly_tree",
+        EnemyBehavior.TACTICAL: "_build_tactical_tree",
+        EnemyBehavior.BOSS: "_build_boss_tree",
+    }
+    
+    def __init__(
+        self,
+        enemy: Enemy,
+        behavior: EnemyBehavior,
+        event_bus: EventBus,
+        seed: Optional[int] = None
+    ):
         """
         Initialize enemy AI with a specific behavior pattern.
         
@@ -51,111 +107,132 @@ class EnemyAI:
             enemy: The enemy entity this AI controls.
             behavior: The behavior pattern to use.
             event_bus: Event bus for publishing game events.
+            seed: Optional seed for a private generator so this AI's random
+                choices are reproducible; the shared random module state is
+                used when omitted.
         """
+        self._randint = _randint if seed is None else random.Random(seed).randint
         self.enemy = enemy
         self.behavior = behavior
         self.event_bus = event_bus
-        self.behavior_tree = self._build_behavior_tree()
+        self.behavior_tree = self._tree_for(behavior)
         self._enraged = False
         self._attack_pattern = 0
+        if behavior == EnemyBehavior.AGGRESSIVE:
+            # The aggressive tree is "attack if possible, else idle"; run it directly
+            self.tick = self._tick_aggressive
     
-    def _build_behavior_tree(self) -> BehaviorTree:
+    @classmethod
+    def _tree_for(cls, behavior: EnemyBehavior) -> BehaviorTree:
         """
-        Create the behavior tree based on the enemy's behavior type.
+        Return the shared behavior tree for a behavior, building it on first use.
         
+        Args:
+            behavior: The behavior pattern the tree implements.
+            
         Returns:
-            BehaviorTree configured for the enemy's behavior pattern.
-        """
-        if self.behavior == EnemyBehavior.AGGRESSIVE:
-            return self._build_aggressive_tree()
-        elif self.behavior == EnemyBehavior.DEFENSIVE:
-            return self._build_defensive_tree()
-        elif self.behavior == EnemyBehavior.COWARDLY:
-            return self._build_cowardly_tree()
-        elif self.behavior == EnemyBehavior.TACTICAL:
-            return self._build_tactical_tree()
-        elif self.behavior == EnemyBehavior.BOSS:
-            return self._build_boss_tree()
-        else:
-            return self._build_aggressive_tree()
+            BehaviorTree shared by all enemies with this behavior.
+        """
+        tree = cls._TREE_CACHE.get(behavior)
+        if tree is None:
+            tree = cls._TREE_CACHE[behavior] = cls._build_behavior_tree(behavior)
+        return tree
     
-    def _build_aggressive_tree(self) -> BehaviorTree:
+    @classmethod
+    def _build_behavior_tree(cls, behavior: EnemyBehavior) -> BehaviorTree:
+        """
+        Create the behavior tree for a behavior type.
+        
+        Args:
+            behavior: The behavior pattern to build.
+            
+        Returns:
+            BehaviorTree configured for the behavior pattern.
+        """
+        return getattr(cls, cls._BUILDERS[behavior])()
+    
+    @classmethod
+    def _build_aggressive_tree(cls) -> BehaviorTree:
         """Build behavior tree for aggressive enemies that always attack."""
         root = SelectorNode("AggressiveRoot", [
             SequenceNode("AttackSequence", [
-                ConditionNode("CanAttack", self._can_attack),
-                ActionNode("Attack", self._attack_hero)
+                ConditionNode("CanAttack", cls._can_attack),
+                ActionNode("Attack", cls._attack_hero)
             ]),
-            ActionNode("Idle", lambda ctx: NodeStatus.SUCCESS)
+            ActionNode("Idle", _idle)
         ])
         return BehaviorTree(root)
     
-    def _build_defensive_tree(self) -> BehaviorTree:
+    @classmethod
+    def _build_defensive_tree(cls) -> BehaviorTree:
         """Build behavior tree for defensive enemies that retreat when hurt."""
         root = SelectorNode("DefensiveRoot", [
             SequenceNode("RetreatSequence", [
-                ConditionNode("ShouldFlee", self._should_flee),
-                ActionNode("Flee", self._flee)
+                ConditionNode("ShouldFlee", cls._should_flee),
+                ActionNode("Flee", cls._flee)
             ]),
             SequenceNode("DefendSequence", [
-                ConditionNode("HeroInRoom", self._hero_in_room),
-                ConditionNode("CanAttack", self._can_attack),
-                ActionNode("Attack", self._attack_hero)
+                ConditionNode("HeroInRoom", cls._hero_in_room),
+                ConditionNode("CanAttack", cls._can_attack),
+                ActionNode("Attack", cls._attack_hero)
             ]),
-            ActionNode("Defend", lambda ctx: NodeStatus.SUCCESS)
+            ActionNode("Defend", _idle)
         ])
         return BehaviorTree(root)
     
-    def _build_cowardly_tree(self) -> BehaviorTree:
+    @classmethod
+    def _build_cowardly_tree(cls) -> BehaviorTree:
         """Build behavior tree for cowardly enemies that flee and call for help."""
         root = SelectorNode("CowardlyRoot", [
             SequenceNode("FleeSequence", [
-                ConditionNode("ShouldFlee", self._should_flee),
-                ActionNode("CallForHelp", self._call_for_help),
-                ActionNode("Flee", self._flee)
+                ConditionNode("ShouldFlee", cls._should_flee),
+                ActionNode("CallForHelp", cls._call_for_help),
+                ActionNode("Flee", cls._flee)
             ]),
             SequenceNode("CautiousAttack", [
-                ConditionNode("CanAttack", self._can_attack),
-                ConditionNode("HealthyEnough", lambda ctx: ctx.enemy.health > ctx.enemy.max_health * 0.5),
-                ActionNode("Attack", self._attack_hero)
+                ConditionNode("CanAttack", cls._can_attack),
+                ConditionNode("HealthyEnough", _healthy_enough),
+                ActionNode("Attack", cls._attack_hero)
             ]),
-            ActionNode("Hide", lambda ctx: NodeStatus.SUCCESS)
+            ActionNode("Hide", _idle)
         ])
         return BehaviorTree(root)
     
-    def _build_tactical_tree(self) -> BehaviorTree:
+    @classmethod
+    def _build_tactical_tree(cls) -> BehaviorTree:
         """Build behavior tree for tactical enemies that coordinate attacks."""
         root = SelectorNode("TacticalRoot", [
             SequenceNode("CoordinatedAttack", [
-                ConditionNode("HasAllies", lambda ctx: len(ctx.nearby_allies) > 0),
-                ConditionNode("CanAttack", self._can_attack),
-                ActionNode("CoordinateAttack", self._coordinate_attack)
+                ConditionNode("HasAllies", _has_allies),
+                ConditionNode("CanAttack", cls._can_attack),
+                ActionNode("CoordinateAttack", cls._coordinate_attack)
             ]),
             SequenceNode("FocusedAttack", [
-                ConditionNode("CanAttack", self._can_attack),
-                ActionNode("Attack", self._attack_hero)
+                ConditionNode("CanAttack", cls._can_attack),
+                ActionNode("Attack", cls._attack_hero)
             ]),
             SequenceNode("TacticalRetreat", [
-                ConditionNode("ShouldFlee", self._should_flee),
-                ActionNode("Flee", self._flee)
+                ConditionNode("ShouldFlee", cls._should_flee),
+                ActionNode("Flee", cls._flee)
             ]),
-            ActionNode("UseTerrain", self._use_terrain)
+            ActionNode("UseTerrain", cls._use_terrain)
         ])
         return BehaviorTree(root)
     
-    def _build_boss_tree(self) -> BehaviorTree:
+    @classmethod
+    def _build_boss_tree(cls) -> BehaviorTree:
         """Build behavior tree for boss enemies with multiple attack patterns."""
         root = SelectorNode("BossRoot", [
             SequenceNode("EnrageSequence", [
-                ConditionNode("LowHealth", lambda ctx: ctx.enemy.health < ctx.enemy.max_health * 0.3),
-                ActionNode("Enrage", self._enrage),
-                ActionNode("SummonMinions", self._summon_minions)
+                ConditionNode("LowHealth", _low_health),
+                ActionNode("Enrage", cls._enrage),
+                ActionNode("SummonMinions", cls._summon_minions)
             ]),
             SequenceNode("SpecialAttack", [
-                ConditionNode("CanAttack", self._can_attack),
-                ActionNode("BossAttackPattern", self._boss_attack_pattern)
+                ConditionNode("CanAttack", cls._can_attack),
+                ActionNode("BossAttackPattern", cls._boss_attack_pattern)
             ]),
-            ActionNode("Intimidate", lambda ctx: NodeStatus.SUCCESS)
+            ActionNode("Intimidate", _idle)
         ])
         return BehaviorTree(root)
     
@@ -171,9 +248,30 @@ class EnemyAI:
         """
         if not self.enemy.is_alive:
             return NodeStatus.FAILURE
+        context.ai = self
         return self.behavior_tree.tick(context)
     
-    def _can_attack(self, ctx: EnemyAIContext) -> bool:
+    def _tick_aggressive(self, context: EnemyAIContext) -> NodeStatus:
+        """
+        Execute one tick of an aggressive enemy without the tree interpreter.
+        
+        Equivalent to ticking the aggressive behavior tree.
+        
+        Args:
+            context: The current game context for decision making.
+            
+        Returns:
+            NodeStatus indicating the result of the AI tick.
+        """
+        if not self.enemy.is_alive:
+            return NodeStatus.FAILURE
+        context.ai = self
+        if EnemyAI._can_attack(context):
+            return EnemyAI._attack_hero(context)
+        return NodeStatus.SUCCESS
+    
+    @staticmethod
+    def _can_attack(ctx: EnemyAIContext) -> bool:
         """
         Check if the enemy can attack the hero.
         
@@ -183,13 +281,15 @@ class EnemyAI:
         Returns:
             True if the enemy can attack, False otherwise.
         """
+        hero = ctx.hero
         return (
             ctx.enemy.is_alive and
-            ctx.hero.is_alive and
-            ctx.hero.current_room_id == ctx.room.room_id
+            hero.is_alive and
+            hero.current_room_id == ctx.room.room_id
         )
     
-    def _attack_hero(self, ctx: EnemyAIContext) -> NodeStatus:
+    @staticmethod
+    def _attack_hero(ctx: EnemyAIContext) -> NodeStatus:
         """
         Execute an attack against the hero.
         
@@ -199,31 +299,35 @@ class EnemyAI:
         Returns:
             NodeStatus.SUCCESS if attack executed, FAILURE otherwise.
         """
-        if not self._can_attack(ctx):
+        if not EnemyAI._can_attack(ctx):
             return NodeStatus.FAILURE
         
-        damage = ctx.enemy.attack
-        actual_damage = ctx.hero.take_damage(damage)
-        
-        ctx.event_bus.publish(Event(
-            EventType.ENEMY_ATTACKED,
-            {
-                "enemy": ctx.enemy.name,
-                "target": ctx.hero.name,
-                "damage": actual_damage,
-                "enemy_type": ctx.enemy.enemy_type.value
-            }
-        ))
-        
-        if not ctx.hero.is_alive:
-            ctx.event_bus.publish(Event(
+        enemy = ctx.enemy
+        hero = ctx.hero
+        event_bus = ctx.event_bus
+        actual_damage = hero.take_damage(enemy.attack)
+        
+        if event_bus.is_observed(EventType.ENEMY_ATTACKED):
+            event_bus.publish(Event(
+                EventType.ENEMY_ATTACKED,
+                {
+                    "enemy": enemy.name,
+                    "target": hero.name,
+                    "damage": actual_damage,
+                    "enemy_type": enemy.enemy_type.value
+                }
+            ))
+        
+        if not hero.is_alive and event_bus.is_observed(EventType.HERO_DIED):
+            event_bus.publish(Event(
                 EventType.HERO_DIED,
-                {"killed_by": ctx.enemy.name}
+                {"killed_by": enemy.name}
             ))
         
         return NodeStatus.SUCCESS
     
-    def _should_flee(self, ctx: EnemyAIContext) -> bool:
+    @staticmethod
+    def _should_flee(ctx: EnemyAIContext) -> bool:
         """
         Determine if the enemy should flee.
         
@@ -233,10 +337,11 @@ class EnemyAI:
         Returns:
             True if enemy should flee, False otherwise.
         """
-        health_threshold = 0.3 if self.behavior == EnemyBehavior.DEFENSIVE else 0.5
+        health_threshold = 0.3 if ctx.ai.behavior == EnemyBehavior.DEFENSIVE else 0.5
         return ctx.enemy.health < ctx.enemy.max_health * health_threshold
     
-    def _flee(self, ctx: EnemyAIContext) -> NodeStatus:
+    @staticmethod
+    def _flee(ctx: EnemyAIContext) -> NodeStatus:
         """
         Attempt to flee from combat.
         
@@ -246,17 +351,20 @@ class EnemyAI:
         Returns:
             NodeStatus.SUCCESS if fleeing, RUNNING if still in combat.
         """
-        ctx.event_bus.publish(Event(
-            EventType.PLAYER_ACTION,
-            {
-                "action": "enemy_flee",
-                "enemy": ctx.enemy.name,
-                "room_id": ctx.room.room_id
-            }
-        ))
+        event_bus = ctx.event_bus
+        if event_bus.is_observed(EventType.PLAYER_ACTION):
+            event_bus.publish(Event(
+                EventType.PLAYER_ACTION,
+                {
+                    "action": "enemy_flee",
+                    "enemy": ctx.enemy.name,
+                    "room_id": ctx.room.room_id
+                }
+            ))
         return NodeStatus.SUCCESS
     
-    def _call_for_help(self, ctx: EnemyAIContext) -> NodeStatus:
+    @staticmethod
+    def _call_for_help(ctx: EnemyAIContext) -> NodeStatus:
         """
         Call for help from nearby allies.
         
@@ -266,23 +374,28 @@ class EnemyAI:
         Returns:
             NodeStatus.SUCCESS if help called.
         """
-        ctx.event_bus.publish(Event(
-            EventType.PLAYER_ACTION,
-            {
-                "action": "call_for_help",
-                "enemy": ctx.enemy.name,
-                "room_id": ctx.room.room_id,
-                "allies_nearby": len(ctx.nearby_allies)
-            }
-        ))
+        enemy = ctx.enemy
+        allies = ctx.nearby_allies
+        event_bus = ctx.event_bus
+        if event_bus.is_observed(EventType.PLAYER_ACTION):
+            event_bus.publish(Event(
+                EventType.PLAYER_ACTION,
+                {
+                    "action": "call_for_help",
+                    "enemy": enemy.name,
+                    "room_id": ctx.room.room_id,
+                    "allies_nearby": len(allies)
+                }
+            ))
         
-        for ally in ctx.nearby_allies:
-            if ally.is_alive and ally != ctx.enemy:
-                ally.attack = int(ally.attack * 1.1)
+        for ally in allies:
+            if ally.is_alive and ally != enemy:
+                ally.attack = ally.attack * 11 // 10
         
         return NodeStatus.SUCCESS
     
-    def _coordinate_attack(self, ctx: EnemyAIContext) -> NodeStatus:
+    @staticmethod
+    def _coordinate_attack(ctx: EnemyAIContext) -> NodeStatus:
         """
         Coordinate an attack with nearby allies for bonus damage.
         
@@ -292,27 +405,33 @@ class EnemyAI:
         Returns:
             NodeStatus.SUCCESS if coordinated attack executed.
         """
-        if not self._can_attack(ctx):
+        if not EnemyAI._can_attack(ctx):
             return NodeStatus.FAILURE
         
-        bonus_damage = len([a for a in ctx.nearby_allies if a.is_alive]) * 2
-        total_damage = ctx.enemy.attack + bonus_damage
-        actual_damage = ctx.hero.take_damage(total_damage)
-        
-        ctx.event_bus.publish(Event(
-            EventType.ENEMY_ATTACKED,
-            {
-                "enemy": ctx.enemy.name,
-                "target": ctx.hero.name,
-                "damage": actual_damage,
-                "coordinated": True,
-                "allies_count": len(ctx.nearby_allies)
-            }
-        ))
+        enemy = ctx.enemy
+        hero = ctx.hero
+        allies = ctx.nearby_allies
+        bonus_damage = sum(1 for a in allies if a.is_alive) * 2
+        total_damage = enemy.attack + bonus_damage
+        actual_damage = hero.take_damage(total_damage)
+        
+        event_bus = ctx.event_bus
+        if event_bus.is_observed(EventType.ENEMY_ATTACKED):
+            event_bus.publish(Event(
+                EventType.ENEMY_ATTACKED,
+                {
+                    "enemy": enemy.name,
+                    "target": hero.name,
+                    "damage": actual_damage,
+                    "coordinated": True,
+                    "allies_count": len(allies)
+                }
+            ))
         
         return NodeStatus.SUCCESS
     
-    def _hero_in_room(self, ctx: EnemyAIContext) -> bool:
+    @staticmethod
+    def _hero_in_room(ctx: EnemyAIContext) -> bool:
         """
         Check if the hero is in the same room as the enemy.
         
@@ -324,7 +443,8 @@ class EnemyAI:
         """
         return ctx.hero.current_room_id == ctx.room.room_id
     
-    def _use_terrain(self, ctx: EnemyAIContext) -> NodeStatus:
+    @staticmethod
+    def _use_terrain(ctx: EnemyAIContext) -> NodeStatus:
         """
         Use terrain for tactical advantage.
         
@@ -336,18 +456,21 @@ class EnemyAI:
         """
         ctx.enemy.defense += 2
         
-        ctx.event_bus.publish(Event(
-            EventType.PLAYER_ACTION,
-            {
-                "action": "use_terrain",
-                "enemy": ctx.enemy.name,
-                "defense_bonus": 2
-            }
-        ))
+        event_bus = ctx.event_bus
+        if event_bus.is_observed(EventType.PLAYER_ACTION):
+            event_bus.publish(Event(
+                EventType.PLAYER_ACTION,
+                {
+                    "action": "use_terrain",
+                    "enemy": ctx.enemy.name,
+                    "defense_bonus": 2
+                }
+            ))
         
         return NodeStatus.SUCCESS
     
-    def _enrage(self, ctx: EnemyAIContext) -> NodeStatus:
+    @staticmethod
+    def _enrage(ctx: EnemyAIContext) -> NodeStatus:
         """
         Enter enraged state at low health (boss behavior).
         
@@ -357,24 +480,29 @@ class EnemyAI:
         Returns:
             NodeStatus.SUCCESS if enraged.
         """
-        if self._enraged:
+        ai = ctx.ai
+        if ai._enraged:
             return NodeStatus.SUCCESS
         
-        self._enraged = True
-        ctx.enemy.attack = int(ctx.enemy.attack * 1.5)
+        ai._enraged = True
+        enemy = ctx.enemy
+        enemy.attack = (enemy.attack * 3) >> 1
         
-        ctx.event_bus.publish(Event(
-            EventType.ENEMY_MUTATED,
-            {
-                "enemy": ctx.enemy.name,
-                "mutation": "enraged",
-                "attack_boost": 1.5
-            }
-        ))
+        event_bus = ctx.event_bus
+        if event_bus.is_observed(EventType.ENEMY_MUTATED):
+            event_bus.publish(Event(
+                EventType.ENEMY_MUTATED,
+                {
+                    "enemy": enemy.name,
+                    "mutation": "enraged",
+                    "attack_boost": 1.5
+                }
+            ))
         
         return NodeStatus.SUCCESS
     
-    def _summon_minions(self, ctx: EnemyAIContext) -> NodeStatus:
+    @staticmethod
+    def _summon_minions(ctx: EnemyAIContext) -> NodeStatus:
         """
         Summon minion enemies (boss behavior).
         
@@ -384,9 +512,14 @@ class EnemyAI:
         Returns:
             NodeStatus.SUCCESS if minions summoned.
         """
-        from models import EnemyType
-        
-        minion_count = random.randint(1, 2)
+        minion_count = ctx.ai._randint(1, 2)
+        room = ctx.room
+        room_id = room.room_id
+        allies = ctx.nearby_allies
+        event_bus = ctx.event_bus
+        announce = event_bus.is_observed(EventType.ENEMY_SPAWNED)
+        summoner_name = ctx.enemy.name
+        spawned = []
         
         for i in range(minion_count):
             minion = Enemy(
@@ -396,21 +529,26 @@ class EnemyAI:
                 attack=5,
                 defense=1
             )
-            ctx.room.add_enemy(minion)
-            ctx.nearby_allies.append(minion)
+            room.add_enemy(minion)
+            allies.append(minion)
             
-            ctx.event_bus.publish(Event(
-                EventType.ENEMY_SPAWNED,
-                {
-                    "enemy": minion.name,
-                    "summoned_by": ctx.enemy.name,
-                    "room_id": ctx.room.room_id
-                }
-            ))
+            if announce:
+                spawned.append(Event(
+                    EventType.ENEMY_SPAWNED,
+                    {
+                        "enemy": minion.name,
+                        "summoned_by": summoner_name,
+                        "room_id": room_id
+                    }
+                ))
+        
+        if spawned:
+            event_bus.publish_many(spawned)
         
         return NodeStatus.SUCCESS
     
-    def _boss_attack_pattern(self, ctx: EnemyAIContext) -> NodeStatus:
+    @staticmethod
+    def _boss_attack_pattern(ctx: EnemyAIContext) -> NodeStatus:
         """
         Execute boss attack patterns that cycle through different attacks.
         
@@ -420,40 +558,36 @@ class EnemyAI:
         Returns:
             NodeStatus.SUCCESS if attack executed.
         """
-        if not self._can_attack(ctx):
+        if not EnemyAI._can_attack(ctx):
             return NodeStatus.FAILURE
         
-        patterns = [
-            ("Normal Attack", 1.0),
-            ("Heavy Strike", 1.5),
-            ("Sweeping Attack", 0.8),
-            ("Devastating Blow", 2.0)
-        ]
-        
-        pattern_name, multiplier = patterns[self._attack_pattern % len(patterns)]
-        self._attack_pattern += 1
-        
-        if self._enraged:
-            multiplier *= 1.3
-        
-        damage = int(ctx.enemy.attack * multiplier)
-        actual_damage = ctx.hero.take_damage(damage)
-        
-        ctx.event_bus.publish(Event(
-            EventType.ENEMY_ATTACKED,
-            {
-                "enemy": ctx.enemy.name,
-                "target": ctx.hero.name,
-                "damage": actual_damage,
-                "pattern": pattern_name,
-                "enraged": self._enraged
-            }
-        ))
-        
-        if not ctx.hero.is_alive:
-            ctx.event_bus.publish(Event(
+        ai = ctx.ai
+        patterns = _BOSS_PATTERNS_ENRAGED if ai._enraged else _BOSS_PATTERNS
+        pattern_name, percent = patterns[ai._attack_pattern & _BOSS_PATTERN_MASK]
+        ai._attack_pattern += 1
+        
+        enemy = ctx.enemy
+        hero = ctx.hero
+        event_bus = ctx.event_bus
+        damage = enemy.attack * percent // 100
+        actual_damage = hero.take_damage(damage)
+        
+        if event_bus.is_observed(EventType.ENEMY_ATTACKED):
+            event_bus.publish(Event(
+                EventType.ENEMY_ATTACKED,
+                {
+                    "enemy": enemy.name,
+                    "target": hero.name,
+                    "damage": actual_damage,
+                    "pattern": pattern_name,
+                    "enraged": ai._enraged
+                }
+            ))
+        
+        if not hero.is_alive and event_bus.is_observed(EventType.HERO_DIED):
+            event_bus.publish(Event(
                 EventType.HERO_DIED,
-                {"killed_by": ctx.enemy.name, "attack_pattern": pattern_name}
+                {"killed_by": enemy.name, "attack_pattern": pattern_name}
             ))
         
         return NodeStatus.SUCCESS
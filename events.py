@@ -2,13 +2,14 @@
 Event-driven system for DungeonCrawlerAI.
 Allows different components to communicate without tight coupling.
 """
+from collections import defaultdict, deque
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence
 from dataclasses import dataclass
 
 
-class EventType(Enum):
-    """Types of events in the game"""
+class EventType(str, Enum):
+    """Types of events in the game (str-backed so members hash at C speed)"""
     # Hero events
     HERO_MOVED = "hero_moved"
     HERO_ATTACKED = "hero_attacked"
@@ -45,7 +46,7 @@ class EventType(Enum):
     GAME_ENDED = "game_ended"
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """Represents a game event"""
     event_type: EventType
@@ -58,36 +59,53 @@ class Event:
 class EventBus:
     """Central event bus for publishing and subscribing to events"""
     
-    def __init__(self):
-        self._subscribers: Dict[EventType, List[Callable[[Event], None]]] = {}
-        self._event_history: List[Event] = []
+    def __init__(self, max_history: int = 10_000):
+        """Create a bus that keeps the most recent max_history events for get_history"""
+        self._subscribers: Dict[EventType, List[Callable[[Event], None]]] = defaultdict(list)
+        self._event_history: Deque[Event] = deque(maxlen=max_history)
+        self._records_history = max_history != 0
     
     def subscribe(self, event_type: EventType, callback: Callable[[Event], None]):
         """Subscribe to an event type"""
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
         self._subscribers[event_type].append(callback)
     
     def unsubscribe(self, event_type: EventType, callback: Callable[[Event], None]):
         """Unsubscribe from an event type"""
-        if event_type in self._subscribers:
-            self._subscribers[event_type] = [
-                cb for cb in self._subscribers[event_type] if cb != callback
-            ]
+        callbacks = self._subscribers.get(event_type)
+        if callbacks and callback in callbacks:
+            # Replace rather than mutate, so a publish already iterating the
+            # old list is unaffected
+            self._subscribers[event_type] = [cb for cb in callbacks if cb != callback]
+    
+    def is_observed(self, event_type: EventType) -> bool:
+        """Whether publishing this event type has any effect (recorded or subscribed)"""
+        return self._records_history or bool(self._subscribers.get(event_type))
     
     def publish(self, event: Event):
         """Publish an event to all subscribers"""
         self._event_history.append(event)
         
-        if event.event_type in self._subscribers:
-            for callback in self._subscribers[event.event_type]:
+        callbacks = self._subscribers.get(event.event_type)
+        if callbacks:
+            for callback in callbacks:
                 callback(event)
     
+    def publish_many(self, events: Sequence[Event]):
+        """Publish several events in order, resolving bus state once"""
+        history = self._event_history
+        subscribers = self._subscribers
+        for event in events:
+            history.append(event)
+            callbacks = subscribers.get(event.event_type)
+            if callbacks:
+                for callback in callbacks:
+                    callback(event)
+    
     def get_history(self, event_type: Optional[EventType] = None) -> List[Event]:
         """Get event history, optionally filtered by type"""
         if event_type:
             return [e for e in self._event_history if e.event_type == event_type]
-        return self._event_history.copy()
+        return list(self._event_history)
     
     def clear_history(self):
         """Clear event history"""
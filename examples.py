@@ -4,6 +4,7 @@ Example use cases for DungeonCrawlerAI.
 Demonstrates various features and configurations.
 """
 from game import DungeonCrawlerGame
+from events import EventType
 import random
 
 
@@ -184,8 +185,6 @@ def example_event_tracking():
     results = game.run_simulation(max_turns=40, verbose=False)
     
     # Analyze events
-    from events import EventType
-    
     event_history = game.event_bus.get_history()
     
     print(f"Total events recorded: {len(event_history)}")
@@ -180,15 +180,19 @@ class EnhancedDungeonCrawlerGame:
         """Apply difficulty modifiers to hero and game systems."""
         settings = self.difficulty_settings
         
-        self.hero.max_health = int(self.hero.max_health * settings.hero_hp_multiplier)
+        hp_num, hp_den = settings.hero_hp_ratio
+        attack_num, attack_den = settings.hero_attack_ratio
+        self.hero.max_health = self.hero.max_health * hp_num // hp_den
         self.hero.health = self.hero.max_health
-        self.hero.attack = int(self.hero.attack * settings.hero_attack_multiplier)
+        self.hero.attack = self.hero.attack * attack_num // attack_den
         
+        enemy_num, enemy_den = settings.enemy_damage_ratio
+        trap_num, trap_den = settings.trap_damage_ratio
         for room in self.dungeon.rooms.values():
             for enemy in room.enemies:
-                enemy.attack = int(enemy.attack * settings.enemy_damage_multiplier)
+                enemy.attack = enemy.attack * enemy_num // enemy_den
             for trap in room.traps:
-                trap.damage = int(trap.damage * settings.trap_damage_multiplier)
+                trap.damage = trap.damage * trap_num // trap_den
     
     def _on_hero_died(self, event: Event) -> None:
         """Handle hero death event."""
@@ -370,10 +374,9 @@ class EnhancedDungeonCrawlerGame:
             if self.auto_player:
                 self._auto_player_action()
         
-        synergy = self.synergy_tracker.check_synergies()
+        synergy = self.synergy_tracker.check_and_apply_synergies(self.curse)
         if synergy and self.curse:
             self.log(f"SYNERGY: {synergy.name} triggered!")
-            self.synergy_tracker.apply_synergy_bonus(synergy, self.curse)
         
         if self.difficulty_settings.suspicion_decay_rate > 0:
             self.hero.suspicion_level = max(
@@ -589,7 +592,7 @@ class EnhancedDungeonCrawlerGame:
             "theme": self.theme.value if self.theme else None,
             "archetype": self.hero_archetype.value if self.hero_archetype else None,
             "game_stats": self._game_stats.copy(),
-            "synergy_stats": self.synergy_tracker.get_synergy_stats(),
+            "synergy_stats": self.synergy_tracker.get_synergy_stats_snapshot(),
         }
     
     def get_game_state_summary(self) -> str:
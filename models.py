@@ -24,6 +24,8 @@ class ItemQuality(Enum):
 
 class Item:
     """Represents an item in the dungeon"""
+    __slots__ = ("item_type", "name", "value", "quality", "original_value")
+    
     def __init__(self, item_type: ItemType, name: str, value: int, quality: ItemQuality = ItemQuality.NORMAL):
         self.item_type = item_type
         self.name = name
@@ -54,6 +56,11 @@ class EnemyType(Enum):
 
 class Enemy:
     """Represents an enemy in the dungeon"""
+    __slots__ = (
+        "enemy_type", "name", "max_health", "health", "base_attack", "attack",
+        "base_defense", "defense", "is_mutated", "is_alive",
+    )
+    
     def __init__(self, enemy_type: EnemyType, name: str, health: int, attack: int, defense: int):
         self.enemy_type = enemy_type
         self.name = name
@@ -70,8 +77,8 @@ class Enemy:
         """Mutate the enemy, increasing its power"""
         if not self.is_mutated:
             self.is_mutated = True
-            self.attack = int(self.attack * 1.5)
-            self.defense = int(self.defense * 1.3)
+            self.attack = (self.attack * 3) >> 1
+            self.defense = self.defense * 13 // 10
             self.max_health = int(self.max_health * 1.4)
             self.health = min(self.max_health, int(self.health * 1.4))
     
@@ -98,6 +105,8 @@ class TrapType(Enum):
 
 class Trap:
     """Represents a trap in a room"""
+    __slots__ = ("trap_type", "damage", "triggered")
+    
     def __init__(self, trap_type: TrapType, damage: int, triggered: bool = False):
         self.trap_type = trap_type
         self.damage = damage
@@ -126,6 +135,8 @@ class RoomType(Enum):
 
 class Room:
     """Represents a room in the dungeon"""
+    __slots__ = ("room_id", "room_type", "items", "enemies", "traps", "connected_rooms", "visited", "altered")
+    
     def __init__(self, room_id: int, room_type: RoomType):
         self.room_id = room_id
         self.room_type = room_type
@@ -181,6 +192,7 @@ class Hero:
         self.is_alive = True
         self.suspicion_level = 0  # Tracks awareness of player interference
         self.gold = 0
+        self._doom_expiry: Optional[int] = None  # Turn a curse doom lands, set by AdvancedCursePowers
     
     def take_damage(self, damage: int) -> int:
         """Apply damage to the hero"""
@@ -3,6 +3,7 @@
 Unit tests for DungeonCrawlerAI.
 Tests core functionality of all game components.
 """
+import random
 import unittest
 from models import (
     Hero, Enemy, EnemyType, Item, ItemType, ItemQuality,
@@ -11,11 +12,16 @@ from models import (
 from dungeon import Dungeon
 from events import EventBus, Event, EventType
 from behavior_tree import (
-    NodeStatus, SequenceNode, SelectorNode,
+    BehaviorTree, NodeStatus, SequenceNode, SelectorNode,
     ConditionNode, ActionNode, InverterNode
 )
 from hero_ai import HeroAI
+from enemy_ai import EnemyAI, EnemyAIContext, EnemyBehavior
 from player_curse import PlayerCurse
+from advanced_curse_powers import AdvancedCursePowers
+from curse_synergies import SynergyTracker, TRAP_GAUNTLET, CORRUPTION_CHAIN, MUTATION_SURGE
+from dungeon_themes import DungeonTheme, apply_theme_to_dungeon
+from dynamic_events import EventManager, DungeonEventType, EVENT_DEFINITIONS
 from game import DungeonCrawlerGame
 
 
@@ -77,6 +83,12 @@ class TestModels(unittest.TestCase):
         self.assertTrue(enemy.is_mutated)
         self.assertGreater(enemy.attack, original_attack)
     
+    def test_mutated_enemy_stays_at_full_health(self):
+        """Test a full-health enemy is still at full health after mutating"""
+        enemy = Enemy(EnemyType.ORC, "Orc", 45, 10, 3)
+        enemy.mutate()
+        self.assertEqual((enemy.health, enemy.max_health), (62, 62))
+    
     def test_enemy_combat(self):
         """Test enemy taking damage"""
         enemy = Enemy(EnemyType.GOBLIN, "Goblin", 30, 8, 2)
@@ -163,6 +175,73 @@ class TestBehaviorTree(unittest.TestCase):
         inverter = InverterNode("Invert", success_node)
         
         self.assertEqual(inverter.tick(None), NodeStatus.FAILURE)
+    
+    def test_compiled_tree(self):
+        """Test compiled tree matches node-by-node evaluation"""
+        calls = []
+        
+        def action(name, status):
+            def run(ctx):
+                calls.append(name)
+                return status
+            return ActionNode(name, run)
+        
+        root = SelectorNode("Root", [
+            SequenceNode("First", [
+                ConditionNode("Never", lambda ctx: False),
+                action("Skipped", NodeStatus.SUCCESS)
+            ]),
+            SequenceNode("Second", [
+                InverterNode("Not", ConditionNode("Never", lambda ctx: False)),
+                action("Busy", NodeStatus.RUNNING),
+                action("Unreached", NodeStatus.SUCCESS)
+            ]),
+            action("Fallback", NodeStatus.SUCCESS)
+        ])
+        
+        self.assertEqual(root.tick(None), NodeStatus.RUNNING)
+        expected_calls = list(calls)
+        calls.clear()
+        
+        tree = BehaviorTree(root)
+        self.assertEqual(tree.tick(None), NodeStatus.RUNNING)
+        self.assertEqual(calls, expected_calls)
+    
+    def test_compiled_tree_memoizes_conditions(self):
+        """Test shared conditions are re-evaluated only after an action runs"""
+        checks = []
+        
+        def can_act(ctx):
+            checks.append(ctx)
+            return True
+        
+        root = SelectorNode("Root", [
+            SequenceNode("First", [
+                ConditionNode("CanAct", can_act),
+                ConditionNode("Never", lambda ctx: False)
+            ]),
+            SequenceNode("Second", [
+                ConditionNode("CanAct", can_act),
+                ActionNode("Fail", lambda ctx: NodeStatus.FAILURE)
+            ]),
+            SequenceNode("Third", [
+                ConditionNode("CanAct", can_act),
+                ActionNode("Act", lambda ctx: NodeStatus.SUCCESS)
+            ])
+        ])
+        tree = BehaviorTree(root)
+        
+        self.assertEqual(tree.tick("tick1"), NodeStatus.SUCCESS)
+        self.assertEqual(checks, ["tick1", "tick1"])
+        
+        tree.tick("tick2")
+        self.assertEqual(checks, ["tick1", "tick1", "tick2", "tick2"])
+    
+    def test_compiled_tree_rejects_non_status_actions(self):
+        """Test an action returning something other than a NodeStatus is reported"""
+        tree = BehaviorTree(ActionNode("Bad", lambda ctx: None))
+        with self.assertRaises(TypeError):
+            tree.tick(None)
 
 
 class TestEventSystem(unittest.TestCase):
@@ -204,6 +283,60 @@ class TestEventSystem(unittest.TestCase):
         
         move_events = bus.get_history(EventType.HERO_MOVED)
         self.assertEqual(len(move_events), 1)
+    
+    def test_event_bus_publish_many(self):
+        """Test publishing a batch of events"""
+        bus = EventBus()
+        received = []
+        bus.subscribe(EventType.HERO_MOVED, received.append)
+        bus.subscribe(EventType.PLAYER_ACTION, received.append)
+        
+        events = (
+            Event(EventType.HERO_MOVED, {}),
+            Event(EventType.ITEM_FOUND, {}),
+            Event(EventType.PLAYER_ACTION, {}),
+        )
+        bus.publish_many(events)
+        
+        self.assertEqual(received, [events[0], events[2]])
+        self.assertEqual(bus.get_history(), list(events))
+    
+    def test_event_bus_history_is_bounded(self):
+        """Test event history keeps only the most recent events"""
+        bus = EventBus(max_history=2)
+        events = [Event(EventType.HERO_MOVED, {"step": i}) for i in range(3)]
+        for event in events:
+            bus.publish(event)
+        
+        self.assertEqual(bus.get_history(), events[1:])
+        self.assertEqual(bus.get_history(EventType.HERO_MOVED), events[1:])
+    
+    def test_event_bus_is_observed(self):
+        """Test a bus without history is observed only by subscribers"""
+        self.assertTrue(EventBus().is_observed(EventType.HERO_MOVED))
+        
+        bus = EventBus(max_history=0)
+        self.assertFalse(bus.is_observed(EventType.HERO_MOVED))
+        bus.subscribe(EventType.HERO_MOVED, lambda event: None)
+        self.assertTrue(bus.is_observed(EventType.HERO_MOVED))
+        self.assertFalse(bus.is_observed(EventType.HERO_DIED))
+    
+    def test_event_bus_unsubscribe(self):
+        """Test unsubscribing, including from inside a callback"""
+        bus = EventBus()
+        received = []
+        
+        def once(event):
+            received.append("once")
+            bus.unsubscribe(EventType.HERO_MOVED, once)
+        
+        bus.subscribe(EventType.HERO_MOVED, once)
+        bus.subscribe(EventType.HERO_MOVED, lambda event: received.append("always"))
+        bus.unsubscribe(EventType.HERO_DIED, once)
+        
+        bus.publish(Event(EventType.HERO_MOVED, {}))
+        bus.publish(Event(EventType.HERO_MOVED, {}))
+        self.assertEqual(received, ["once", "always", "always"])
 
 
 class TestDungeon(unittest.TestCase):
@@ -237,6 +370,157 @@ class TestDungeon(unittest.TestCase):
         treasure_room = dungeon.get_room(8)
         self.assertEqual(treasure_room.room_type, RoomType.TREASURE)
         self.assertGreater(len(treasure_room.items), 0)
+    
+    def test_seeded_dungeon(self):
+        """Test a seed reproduces the same layout"""
+        def layout(dungeon):
+            return [
+                (room.connected_rooms, [e.name for e in room.enemies],
+                 [(i.name, i.value) for i in room.items], [t.damage for t in room.traps])
+                for room in dungeon.rooms.values()
+            ]
+        
+        self.assertEqual(layout(Dungeon(12, seed=7)), layout(Dungeon(12, seed=7)))
+
+
+class TestDungeonThemes(unittest.TestCase):
+    """Test dungeon theme application"""
+    
+    def test_apply_theme(self):
+        """Test a theme swaps in themed enemies and keeps room contents sized"""
+        dungeon = Dungeon(10, seed=3)
+        counts = [(len(r.enemies), len(r.traps)) for r in dungeon.rooms.values()]
+        
+        apply_theme_to_dungeon(dungeon, DungeonTheme.VOLCANIC)
+        self.assertIs(dungeon.theme, DungeonTheme.VOLCANIC)
+        self.assertEqual(counts, [(len(r.enemies), len(r.traps)) for r in dungeon.rooms.values()])
+        names = {e.name for r in dungeon.rooms.values() for e in r.enemies}
+        self.assertTrue(names <= {"Fire Elemental", "Lava Golem"})
+        self.assertTrue(all(t.damage >= 1 for r in dungeon.rooms.values() for t in r.traps))
+    
+    def test_reapplying_theme_is_noop(self):
+        """Test applying the current theme again leaves the dungeon untouched"""
+        dungeon = Dungeon(10, seed=3)
+        apply_theme_to_dungeon(dungeon, DungeonTheme.UNDEAD_CRYPT)
+        enemies = [list(r.enemies) for r in dungeon.rooms.values()]
+        
+        apply_theme_to_dungeon(dungeon, DungeonTheme.UNDEAD_CRYPT)
+        self.assertEqual(enemies, [r.enemies for r in dungeon.rooms.values()])
+
+
+class TestEventManager(unittest.TestCase):
+    """Test dynamic dungeon events"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.manager = EventManager()
+    
+    def test_tick_uses_listed_probabilities(self):
+        """Test each event fires at roughly its listed probability"""
+        random.seed(11)
+        turns = 20000
+        counts = {}
+        for _ in range(turns):
+            event = self.manager.tick()
+            if event:
+                counts[event.event_type] = counts.get(event.event_type, 0) + 1
+        
+        for event_type, definition in EVENT_DEFINITIONS.items():
+            self.assertAlmostEqual(counts.get(event_type, 0) / turns, definition["probability"], delta=0.01)
+    
+    def test_seeded_manager_is_reproducible(self):
+        """Test seeded event managers roll the same events"""
+        first = EventManager(seed=5)
+        second = EventManager(seed=5)
+        for _ in range(200):
+            a, b = first.tick(), second.tick()
+            self.assertEqual(a and a.event_type, b and b.event_type)
+    
+    def test_event_cooldown_skips_rolls(self):
+        """Test no random event is rolled during the cooldown window"""
+        manager = EventManager(event_cooldown=2)
+        rolls = []
+        manager._random = lambda: rolls.append(0.0) or 0.0
+        manager.trigger_event(DungeonEventType.FLOOD)
+        
+        self.assertIsNone(manager.tick())
+        self.assertIsNone(manager.tick())
+        self.assertEqual(rolls, [])
+        self.assertIsNotNone(manager.tick())
+        self.assertEqual(len(rolls), 1)
+    
+    def test_effect_handlers_follow_event_order(self):
+        """Test each event type indexes its own effect handler"""
+        for event_type in DungeonEventType:
+            handler = EventManager._EFFECT_HANDLERS[event_type]
+            self.assertEqual(handler.__name__, f"_apply_{event_type.name.lower()}")
+    
+    def test_active_modifiers_stack(self):
+        """Test modifiers from several active events combine"""
+        self.manager.trigger_event(DungeonEventType.HERO_BLESSED)
+        self.manager.trigger_event(DungeonEventType.SOUL_ECHO)
+        self.manager.trigger_event(DungeonEventType.VOID_RIFT)
+        self.manager.trigger_event(DungeonEventType.BLESSING)
+        
+        modifiers = self.manager.get_active_modifiers()
+        self.assertEqual(modifiers["hero_attack_bonus"], 15)
+        self.assertEqual(modifiers["hero_defense_bonus"], 5)
+        self.assertEqual(modifiers["hero_damage_per_turn"], 5)
+        self.assertAlmostEqual(modifiers["curse_cost_modifier"], 0.75)
+        self.assertFalse(modifiers["curse_stunned"])
+    
+    def test_collapse_blocks_room(self):
+        """Test a collapse blocks a room next to the hero"""
+        dungeon = Dungeon(5)
+        hero = Hero("Test Hero")
+        hero.current_room_id = dungeon.entrance_room_id
+        event = self.manager.trigger_event(DungeonEventType.COLLAPSE)
+        self.manager.apply_event_effects(event, hero, None, dungeon)
+        
+        blocked = self.manager.get_blocked_rooms()
+        self.assertEqual(len(blocked), 1)
+        self.assertIn(blocked[0], dungeon.get_connected_rooms(dungeon.entrance_room_id))
+        self.assertTrue(self.manager.is_room_blocked(blocked[0]))
+    
+    def test_earthquake_triggers_hero_room_traps(self):
+        """Test an earthquake springs only the traps in the hero's room"""
+        dungeon = Dungeon(5)
+        hero = Hero("Test Hero")
+        hero.current_room_id = 1
+        for room in dungeon.rooms.values():
+            room.traps = [Trap(TrapType.SPIKE, 4), Trap(TrapType.FIRE, 6)]
+        dungeon.get_room(1).traps[1].triggered = True
+        
+        event = self.manager.trigger_event(DungeonEventType.EARTHQUAKE)
+        self.manager.apply_event_effects(event, hero, None, dungeon)
+        
+        self.assertEqual(hero.health, hero.max_health - max(1, 4 - hero.defense))
+        self.assertTrue(all(t.triggered for t in dungeon.get_room(1).traps))
+        self.assertFalse(dungeon.get_room(2).traps[0].triggered)
+    
+    def test_forecast_tracks_active_events(self):
+        """Test the forecast reflects events as they start and expire"""
+        self.manager.trigger_event(DungeonEventType.VOID_RIFT)
+        self.manager.trigger_event(DungeonEventType.CURSE_STRENGTHENED)
+        forecast = self.manager.get_event_forecast()
+        self.assertIn("Divine intervention likely due to curse activity", forecast)
+        self.assertFalse(any(line.startswith("Curse Strengthened") for line in forecast))
+        
+        for _ in range(3):
+            self.manager.update_active_events()
+        forecast = self.manager.get_event_forecast()
+        self.assertNotIn("Divine intervention likely due to curse activity", forecast)
+        self.assertTrue(any(line.startswith("Curse Strengthened") for line in forecast))
+    
+    def test_event_history_is_bounded(self):
+        """Test event history keeps only the most recent events"""
+        manager = EventManager(max_history=3)
+        for event_type in list(DungeonEventType)[:5]:
+            manager.trigger_event(event_type)
+        self.assertEqual(
+            [e.event_type for e in manager.event_history],
+            list(DungeonEventType)[2:5]
+        )
 
 
 class TestPlayerCurse(unittest.TestCase):
@@ -298,6 +582,197 @@ class TestPlayerCurse(unittest.TestCase):
         self.assertTrue(enemy.is_mutated)
 
 
+class TestAdvancedCursePowers(unittest.TestCase):
+    """Test advanced curse powers"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.event_bus = EventBus()
+        self.dungeon = Dungeon(6)
+        self.curse = AdvancedCursePowers(self.dungeon, self.event_bus)
+        self.curse.curse_energy = self.curse.max_curse_energy
+    
+    def test_doom_countdown(self):
+        """Test doom counts down and triggers once"""
+        hero = Hero()
+        self.assertTrue(self.curse.doom(hero))
+        self.assertEqual(self.curse.is_hero_doomed(hero), 5)
+        
+        for _ in range(4):
+            self.curse.advance_turn()
+        self.assertEqual(self.curse.is_hero_doomed(hero), 1)
+        
+        self.curse.advance_turn()
+        self.assertIsNone(self.curse.is_hero_doomed(hero))
+        triggered = [
+            e for e in self.event_bus.get_history(EventType.PLAYER_ACTION)
+            if e.data["action"] == "doom_triggered"
+        ]
+        self.assertEqual(len(triggered), 1)
+    
+    def test_charm_expires(self):
+        """Test charmed enemies are released after the charm duration"""
+        room = self.dungeon.get_room(1)
+        room.enemies.clear()
+        room.add_enemy(Enemy(EnemyType.GOBLIN, "Goblin", 30, 8, 2))
+        
+        self.assertTrue(self.curse.charm_enemy(1, 0))
+        for _ in range(2):
+            self.curse.advance_turn()
+        self.assertTrue(self.curse.is_enemy_charmed(1, 0))
+        
+        self.curse.advance_turn()
+        self.assertFalse(self.curse.is_enemy_charmed(1, 0))
+    
+    def test_teleport_skips_destroyed_rooms(self):
+        """Test teleport never targets the current or a collapsed room"""
+        hero = Hero()
+        hero.current_room_id = 1
+        self.assertTrue(self.curse.dungeon_collapse(2, hero))
+        
+        for _ in range(20):
+            self.curse.curse_energy = self.curse.max_curse_energy
+            self.curse.current_turn += 10  # Skip past the cooldown
+            start = hero.current_room_id
+            self.assertTrue(self.curse.teleport_hero(hero, 0))
+            self.assertNotEqual(hero.current_room_id, start)
+            self.assertNotEqual(hero.current_room_id, 2)
+
+    
+    def test_collapse_unlinks_connections_added_later(self):
+        """Test a collapse severs connections made after the curse was created"""
+        self.dungeon.get_room(2).connected_rooms.append(4)
+        self.dungeon.get_room(4).connected_rooms.append(2)
+        
+        self.assertTrue(self.curse.dungeon_collapse(2, Hero()))
+        for room in self.dungeon.rooms.values():
+            self.assertNotIn(2, room.connected_rooms)
+
+    
+    def test_room_added_after_creation(self):
+        """Test powers work on a room id added after the curse was created"""
+        room = Room(10, RoomType.NORMAL)
+        room.connected_rooms.append(2)
+        self.dungeon.rooms[10] = room
+        self.dungeon.get_room(2).connected_rooms.append(10)
+        
+        self.assertTrue(self.curse.summon_enemy(10, EnemyType.GOBLIN))
+        self.curse.current_turn += 10  # Skip past the cooldown
+        self.curse.curse_energy = self.curse.max_curse_energy
+        self.assertTrue(self.curse.dungeon_collapse(10, Hero()))
+        self.assertTrue(self.curse.is_room_destroyed(10))
+        self.assertFalse(self.curse.summon_enemy(10, EnemyType.GOBLIN))
+    
+    def test_dungeon_without_rooms(self):
+        """Test the curse can be created for an empty dungeon"""
+        self.dungeon.rooms.clear()
+        curse = AdvancedCursePowers(self.dungeon, self.event_bus)
+        self.assertFalse(curse.is_room_destroyed(0))
+        self.assertFalse(curse.summon_enemy(0, EnemyType.GOBLIN))
+
+
+class TestSynergyTracker(unittest.TestCase):
+    """Test curse synergy detection"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tracker = SynergyTracker()
+    
+    def test_synergy_detected(self):
+        """Test a completed power sequence triggers its synergy once"""
+        for power in ["doom", "spawn_trap", "alter_room", "trigger_trap"]:
+            self.tracker.track_power(power)
+        
+        self.assertIs(self.tracker.check_synergies(), TRAP_GAUNTLET)
+        self.assertEqual(list(self.tracker.recent_powers), ["doom"])
+        self.assertIsNone(self.tracker.check_synergies())
+        self.assertEqual(self.tracker.get_synergy_stats(), {"Trap Gauntlet": 1})
+    
+    def test_matched_powers_are_consumed(self):
+        """Test powers used by one synergy don't count toward the next"""
+        for _ in range(4):
+            self.tracker.track_power("corrupt_loot")
+        self.assertIs(self.tracker.check_synergies(), CORRUPTION_CHAIN)
+        self.assertIsNone(self.tracker.check_synergies())
+        
+        for _ in range(2):
+            self.tracker.track_power("corrupt_loot")
+        self.assertIs(self.tracker.check_synergies(), CORRUPTION_CHAIN)
+    
+    def test_consumed_match_keeps_earlier_powers(self):
+        """Test powers left before a consumed match still start a synergy"""
+        for power in ["mutate_enemy"] * 3 + ["summon_enemy"]:
+            self.tracker.track_power(power)
+        self.assertIs(self.tracker.check_synergies(), MUTATION_SURGE)
+        
+        for power in ["mutate_enemy", "summon_enemy"]:
+            self.tracker.track_power(power)
+        self.assertEqual(
+            list(self.tracker.recent_powers),
+            ["mutate_enemy", "mutate_enemy", "summon_enemy"]
+        )
+        progress = self.tracker.get_progress_toward_synergies()
+        self.assertEqual(progress["Mutation Surge"]["percentage"], 100)
+        self.assertIs(self.tracker.check_synergies(), MUTATION_SURGE)
+        self.assertEqual(list(self.tracker.recent_powers), [])
+    
+    def test_sequence_longer_than_history_never_triggers(self):
+        """Test a synergy can't trigger when the window can't hold it"""
+        tracker = SynergyTracker(max_history=2)
+        for _ in range(3):
+            tracker.track_power("corrupt_loot")
+        self.assertIsNone(tracker.check_synergies())
+    
+    def test_match_rolled_out_of_history_is_dropped(self):
+        """Test a match whose powers left the history no longer triggers"""
+        for _ in range(3):
+            self.tracker.track_power("corrupt_loot")
+        for _ in range(10):
+            self.tracker.track_power("alter_room")
+        self.assertIsNone(self.tracker.check_synergies())
+        self.assertEqual(list(self.tracker.recent_powers), ["alter_room"] * 10)
+    
+    def test_progress_toward_synergies(self):
+        """Test progress counts the sequence prefix ending the history"""
+        for power in ["spawn_trap", "spawn_trap", "alter_room"]:
+            self.tracker.track_power(power)
+        
+        progress = self.tracker.get_progress_toward_synergies()
+        self.assertEqual(progress["Trap Gauntlet"]["matched"], 2)
+        self.assertEqual(progress["Trap Gauntlet"]["next_power"], "trigger_trap")
+        self.assertEqual(progress["Corruption Chain"]["percentage"], 0)
+    
+    def test_apply_trap_gauntlet(self):
+        """Test Trap Gauntlet refunds energy and buffs trap damage"""
+        curse = AdvancedCursePowers(Dungeon(4), EventBus())
+        curse.curse_energy = 0
+        room = curse.dungeon.get_room(1)
+        room.traps.clear()
+        room.add_trap(Trap(TrapType.SPIKE, 15))
+        
+        self.tracker.apply_synergy_bonus(TRAP_GAUNTLET, curse)
+        self.assertEqual(room.traps[0].damage, 22)
+        self.assertEqual(curse.curse_energy, curse.max_curse_energy // 4)
+    
+    def test_check_and_apply_synergies(self):
+        """Test a synergy is applied and both events are published in order"""
+        event_bus = EventBus()
+        tracker = SynergyTracker(event_bus)
+        curse = AdvancedCursePowers(Dungeon(4), event_bus)
+        for _ in range(3):
+            tracker.track_power("corrupt_loot")
+        
+        self.assertIs(tracker.check_and_apply_synergies(curse), CORRUPTION_CHAIN)
+        actions = [e.data["action"] for e in event_bus.get_history(EventType.PLAYER_ACTION)]
+        self.assertEqual(actions, ["synergy_triggered", "synergy_applied"])
+    
+    def test_interrupted_sequence(self):
+        """Test an unrelated power breaks a partial sequence"""
+        for power in ["spawn_trap", "alter_room", "doom", "trigger_trap"]:
+            self.tracker.track_power(power)
+        self.assertIsNone(self.tracker.check_synergies())
+
+
 class TestHeroAI(unittest.TestCase):
     """Test hero AI behavior"""
     
@@ -354,6 +829,73 @@ class TestHeroAI(unittest.TestCase):
         self.assertLess(enemy.health, 10)  # Enemy took damage
 
 
+class TestEnemyAI(unittest.TestCase):
+    """Test enemy AI behaviors"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.event_bus = EventBus()
+        self.room = Room(1, RoomType.BOSS)
+        self.hero = Hero("Test Hero")
+        self.hero.current_room_id = 1
+    
+    def _context(self, enemy):
+        """Build an AI context for an enemy in the test room"""
+        return EnemyAIContext(enemy, self.room, self.hero, self.event_bus, [])
+    
+    def test_aggressive_enemy_attacks(self):
+        """Test an aggressive enemy attacks a hero in its room"""
+        enemy = Enemy(EnemyType.ORC, "Orc", 50, 12, 5)
+        ai = EnemyAI(enemy, EnemyBehavior.AGGRESSIVE, self.event_bus)
+        
+        self.assertEqual(ai.tick(self._context(enemy)), NodeStatus.SUCCESS)
+        self.assertLess(self.hero.health, self.hero.max_health)
+        self.assertEqual(len(self.event_bus.get_history(EventType.ENEMY_ATTACKED)), 1)
+    
+    def test_aggressive_fast_path_matches_tree(self):
+        """Test the aggressive fast path returns what its tree would"""
+        for hero_room in (1, 2):
+            self.hero.current_room_id = hero_room
+            enemy = Enemy(EnemyType.ORC, "Orc", 50, 12, 5)
+            ai = EnemyAI(enemy, EnemyBehavior.AGGRESSIVE, self.event_bus)
+            self.hero.health = self.hero.max_health
+            fast = ai.tick(self._context(enemy))
+            fast_health = self.hero.health
+            
+            self.hero.health = self.hero.max_health
+            context = self._context(enemy)
+            context.ai = ai
+            self.assertEqual(ai.behavior_tree.tick(context), fast)
+            self.assertEqual(self.hero.health, fast_health)
+    
+    def test_shared_tree_keeps_state_per_enemy(self):
+        """Test enemies sharing a behavior tree keep their own state"""
+        first = EnemyAI(Enemy(EnemyType.DRAGON, "Dragon", 150, 10, 10), EnemyBehavior.BOSS, self.event_bus)
+        second = EnemyAI(Enemy(EnemyType.DRAGON, "Wyrm", 150, 10, 10), EnemyBehavior.BOSS, self.event_bus)
+        self.assertIs(first.behavior_tree, second.behavior_tree)
+        
+        first.tick(self._context(first.enemy))
+        first.tick(self._context(first.enemy))
+        second.tick(self._context(second.enemy))
+        
+        patterns = [e.data["pattern"] for e in self.event_bus.get_history(EventType.ENEMY_ATTACKED)]
+        self.assertEqual(patterns, ["Normal Attack", "Heavy Strike", "Normal Attack"])
+    
+    def test_seeded_boss_summons_reproducibly(self):
+        """Test seeded boss AIs summon the same minions"""
+        counts = []
+        for _ in range(2):
+            room = Room(1, RoomType.BOSS)
+            boss = Enemy(EnemyType.DRAGON, "Dragon", 150, 10, 10)
+            boss.health = 10
+            ai = EnemyAI(boss, EnemyBehavior.BOSS, self.event_bus, seed=4)
+            for _ in range(5):
+                ai.tick(EnemyAIContext(boss, room, self.hero, self.event_bus, []))
+            counts.append(len(room.enemies))
+        self.assertEqual(counts[0], counts[1])
+        self.assertGreater(counts[0], 0)
+
+
 class TestGame(unittest.TestCase):
     """Test game integration"""
     
@@ -402,8 +944,13 @@ def run_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestBehaviorTree))
     suite.addTests(loader.loadTestsFromTestCase(TestEventSystem))
     suite.addTests(loader.loadTestsFromTestCase(TestDungeon))
+    suite.addTests(loader.loadTestsFromTestCase(TestDungeonThemes))
+    suite.addTests(loader.loadTestsFromTestCase(TestEventManager))
     suite.addTests(loader.loadTestsFromTestCase(TestPlayerCurse))
+    suite.addTests(loader.loadTestsFromTestCase(TestAdvancedCursePowers))
+    suite.addTests(loader.loadTestsFromTestCase(TestSynergyTracker))
     suite.addTests(loader.loadTestsFromTestCase(TestHeroAI))
+    suite.addTests(loader.loadTestsFromTestCase(TestEnemyAI))
     suite.addTests(loader.loadTestsFromTestCase(TestGame))
     
     # Run tests